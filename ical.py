@@ -8,30 +8,46 @@
 #   image attach/replace/cleanup, daily rules, weekly duplicates, locking, overlap prevention.
 
 from __future__ import annotations
-from typing import List, Dict, Optional, Set, Tuple
-from dataclasses import dataclass, field, replace
-from copy import deepcopy
+from typing import TYPE_CHECKING, List, Dict, Optional, Set, Tuple
+from dataclasses import dataclass, field, fields, replace
+from contextlib import contextmanager
 from pathlib import Path
 import csv
+import io
 import configparser
 import uuid
+import os
 import sys
-import subprocess
 import json
-
-from PySide6.QtCore import Qt, QRect, QRectF, QSize, QDate, QTime, QTimer, QPoint, QDateTime, QUrl
+import functools
+import threading
+import heapq
+import itertools
+from bisect import bisect_left, bisect_right
+
+from PySide6.QtCore import (
+    Qt, QRect, QRectF, QSize, QDate, QTime, QTimer, QPoint, QPointF, QDateTime, QUrl,
+    QObject, QRunnable, QThreadPool, Signal, QSignalBlocker, QProcess
+)
 from PySide6.QtGui import (
-    QPainter, QPen, QBrush, QColor, QFont, QAction, QFontMetrics, QPixmap, QImage,
-    QShortcut, QKeySequence, QFontDatabase
+    QPainter, QPen, QBrush, QColor, QFont, QAction, QFontMetrics, QPixmap, QImageReader,
+    QShortcut, QKeySequence, QFontDatabase, QPalette, QRegion, QStaticText
 )
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QScrollArea, QCalendarWidget,
     QDockWidget, QToolBar, QComboBox, QSlider, QLabel, QMenu, QDialog,
     QDialogButtonBox, QGridLayout, QPushButton, QMessageBox, QSpinBox, QCheckBox,
     QHBoxLayout, QLineEdit, QTimeEdit, QGroupBox, QFileDialog, QTabWidget,
-    QToolButton, QRubberBand, QListWidget, QListWidgetItem, QSystemTrayIcon, QStyle
+    QToolButton, QRubberBand, QListWidget, QListWidgetItem, QSystemTrayIcon, QStyle, QFrame,
+    QColorDialog
 )
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+try:  # optional: faster history serialization (see _dumps_compact)
+    import orjson
+except ImportError:
+    orjson = None
+if TYPE_CHECKING:
+    # Imported lazily in play_notification_sound: loading QtMultimedia spins up the audio backend
+    from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 APP_DIR = Path(__file__).resolve().parent
 PREF_PATH = APP_DIR / "pref.ini"
@@ -40,7 +56,36 @@ RULES_PATH = APP_DIR / "rules.csv"
 UPLOAD_DIR = APP_DIR / "uploads"
 HISTORY_PATH = APP_DIR / "history.csv"
 
+MINUTES_PER_DAY = 24 * 60
+MAX_MINUTE = MINUTES_PER_DAY - 1  # last minute an event may start at
 BASE_PX_PER_MIN = 3.0  # "100%" equals old 300% zoom density
+TIME_SIZE_CHOICES = ("1", "2", "3", "4", "5", "6", "7", "8", "9", "10", "22", "24", "30", "60")  # toolbar combo, minutes
+_MAC_SUBTITLE_FRAG = f'subtitle {json.dumps("iCal-ish Reminder")}'  # constant part of every osascript reminder
+# Qt enums read on every EventWidget paint / mouse sample, resolved once
+_LEFT = Qt.MouseButton.LeftButton
+_OPEN_HAND = Qt.CursorShape.OpenHandCursor
+_CLOSED_HAND = Qt.CursorShape.ClosedHandCursor
+_SIZE_VER = Qt.CursorShape.SizeVerCursor
+_FORBIDDEN = Qt.CursorShape.ForbiddenCursor
+_ANTIALIAS = QPainter.RenderHint.Antialiasing
+_ALIGN_VCENTER_CENTER = Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignHCenter
+
+# CSV column order -> value used when an older file's header lacks that column
+RULES_COLUMNS: Dict[str, object] = {
+    "id": "", "type": "", "start_min": 0, "end_min": 0, "title": "", "tag": "",
+    "color": "#4879C5", "locked": "0", "image": "", "notify_offset": 0,
+}
+DATA_COLUMNS: Dict[str, object] = {
+    "date": "", "start_min": 0, "end_min": 0, "title": "", "tag": "",
+    "color": "#4879C5", "locked": "0", "image": "", "notify_offset": 0,
+}
+HISTORY_COLUMNS = ("timestamp", "action", "date", "events")
+HISTORY_LOG_COMPACT_AT = 30  # history.csv rows appended before it is rewritten down to the last 10
+
+# path -> (st_mtime_ns, Prefs) so repeated from_config calls skip re-parsing pref.ini
+_PREFS_CACHE: Dict[Path, Tuple[int, "Prefs"]] = {}
+# (abs path, st_mtime_ns) -> 96x96 preview used by EventEditDialog
+_THUMB_CACHE: Dict[Tuple[str, int], QPixmap] = {}
 
 
 def ensure_uploads():
@@ -50,30 +95,165 @@ def ensure_uploads():
         pass
 
 
+@functools.lru_cache(maxsize=256)
+def _color_button_style(color_hex: str) -> str:
+    """Stylesheet for a color-picker button filled with color_hex and contrasting text."""
+    color = hex_to_qcolor(color_hex, "#4879C5")
+    r, g, b = color.red(), color.green(), color.blue()
+    luminance = (77 * r + 150 * g + 29 * b) >> 8  # integer Rec.601 weights (x256)
+    text_color = "#000000" if luminance > 186 else "#FFFFFF"
+    return f"background-color: {color.name(QColor.NameFormat.HexRgb)}; color: {text_color}; padding:6px;"
+
+
+@functools.lru_cache(maxsize=2048)
+def _fmt_hhmm(m: int, is_24h: bool) -> str:
+    h, mi = divmod(m, 60)
+    if is_24h: return f"{h:02d}:{mi:02d}"
+    suffix = "AM" if h < 12 else "PM"; h12 = h % 12 or 12; return f"{h12}:{mi:02d} {suffix}"
+
+
+@functools.lru_cache(maxsize=1440)
+def _fmt_duration(m: int) -> str:
+    """"1h 5m" / "1h" / "5m"; zero or negative reads "0m"."""
+    h, mi = divmod(max(0, m), 60)
+    if h and mi: return f"{h}h {mi}m"
+    if h: return f"{h}h"
+    return f"{mi}m"
+
+
+def _json_compact(obj) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps_compact(obj) -> str:
+    """_json_compact text, produced by orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:  # orjson.JSONEncodeError, e.g. a lone surrogate json tolerates
+            pass
+    return _json_compact(obj)
+
+
+def resolve_image_path(image_rel: Optional[str]) -> Optional[str]:
+    """Absolute path of an attached image (relative paths are under APP_DIR), or None if missing."""
+    if not image_rel:
+        return None
+    candidate = Path(image_rel)
+    if not candidate.is_absolute():
+        candidate = APP_DIR / candidate
+    return str(candidate) if candidate.exists() else None
+
+
 def qcolor_to_hex(c: QColor) -> str:
     return c.name(QColor.NameFormat.HexRgb)
 
 
+@functools.lru_cache(maxsize=512)
 def hex_to_qcolor(s: str, fallback: str = "#000000") -> QColor:
+    # Memoized: the returned QColor is shared, so copy it (QColor(c)) before mutating.
     c = QColor(s)
     if not c.isValid():
         c = QColor(fallback)
     return c
 
 
+def _fast_ini_read(path: Path) -> Dict[str, Dict[str, str]]:
+    """Single-pass reader for pref.ini; mirrors the ConfigParser behaviour Prefs relies on
+    (lower-cased keys, '=' or ':' delimiters, stripped values, unreadable file -> empty)."""
+    sections: Dict[str, Dict[str, str]] = {}
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return sections
+    current: Optional[Dict[str, str]] = None
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line[0] == "[" and line[-1] == "]":
+            current = sections.setdefault(line[1:-1].strip(), {})
+            continue
+        if current is None:
+            continue
+        eq = line.find("="); colon = line.find(":")
+        cut = eq if colon < 0 or (0 <= eq < colon) else colon
+        if cut <= 0:
+            continue
+        current[line[:cut].strip().lower()] = line[cut + 1:].strip()
+    return sections
+
+
+@contextmanager
+def _atomic_open(path: Path, durable: bool = True):
+    """Text handle for rewriting `path`: writes go to a sibling .tmp that replaces `path` only once
+    the block finishes, so a crash mid-save leaves the previous file intact. `durable` adds one
+    fsync before the swap so the new contents are on disk, not just in the page cache."""
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with tmp.open("w", encoding="utf-8", newline="") as f:
+            yield f
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _csv_records(reader, columns: Dict[str, object]):
+    """Yield the rows of csv `reader` as lists ordered like `columns`, wherever the header puts them.
+    Blank lines are skipped and fields a short row lacks read as None, as csv.DictReader does."""
+    header = next(reader, None)
+    if header is None:
+        return
+    names = tuple(columns)
+    n = len(names)
+    if tuple(header[:n]) == names:  # the layout save_* writes: slice rows as they come
+        for row in reader:
+            if not row:
+                continue
+            yield row[:n] if len(row) >= n else row + [None] * (n - len(row))
+        return
+    # foreign/older layout: resolve each column's position once; -1 means "use the default"
+    pos = [header.index(name) if name in header else -1 for name in names]
+    defaults = tuple(columns.values())
+    for row in reader:
+        if not row:
+            continue
+        width = len(row)
+        yield [(row[i] if i < width else None) if i >= 0 else d for i, d in zip(pos, defaults)]
+
+
 def save_png_square_256(src_path: Path) -> Optional[str]:
     """Load an image, center-crop to square, downscale to 256x256, save to uploads/, return relative path."""
     try:
-        img = QImage(str(src_path))
-        if img.isNull():
-            return None
-        w, h = img.width(), img.height()
-        side = min(w, h)
-        x = (w - side) // 2
-        y = (h - side) // 2
-        cropped = img.copy(x, y, side, side)
-        scaled = cropped.scaled(256, 256, Qt.AspectRatioMode.IgnoreAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation)
+        reader = QImageReader(str(src_path))
+        reader.setAutoTransform(True)
+        size = reader.size()
+        if size.isValid():
+            # Let the reader crop + downscale while decoding instead of materialising the full image
+            # (a centred square is unaffected by the EXIF rotation autoTransform applies afterwards)
+            w, h = size.width(), size.height()
+            side = min(w, h)
+            reader.setClipRect(QRect((w - side) // 2, (h - side) // 2, side, side))
+            reader.setScaledSize(QSize(256, 256))
+            scaled = reader.read()
+            if scaled.isNull():
+                return None
+        else:
+            img = reader.read()
+            if img.isNull():
+                return None
+            w, h = img.width(), img.height()
+            side = min(w, h)
+            cropped = img.copy((w - side) // 2, (h - side) // 2, side, side)
+            scaled = cropped.scaled(256, 256, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                    Qt.TransformationMode.SmoothTransformation)
         UPLOAD_DIR.mkdir(exist_ok=True)
         name = f"{uuid.uuid4().hex}.png"
         out_path = UPLOAD_DIR / name
@@ -83,6 +263,30 @@ def save_png_square_256(src_path: Path) -> Optional[str]:
         return None
 
 
+class _PngSquareSignals(QObject):
+    done = Signal(object)  # relative path str, or None on failure
+
+
+class PngSquareTask(QRunnable):
+    """Runs save_png_square_256 on the global thread pool; result is delivered via signals.done."""
+    def __init__(self, src_path: Path):
+        super().__init__()
+        self.src_path = src_path
+        self.signals = _PngSquareSignals()
+        self.result: Optional[str] = None
+        self._finished = threading.Event()
+
+    def run(self):
+        self.result = save_png_square_256(self.src_path)
+        self._finished.set()
+        self.signals.done.emit(self.result)
+
+    def wait(self) -> Optional[str]:
+        """Block until run() has written its file; returns the same value as signals.done."""
+        self._finished.wait()
+        return self.result
+
+
 def _pick_font_family(candidates: List[str], fallback: str) -> str:
     """Return the first candidate available on this system, otherwise default family."""
     try:
@@ -127,33 +331,50 @@ def make_ui_font(size: int = 9, weight: QFont.Weight = QFont.Weight.Normal,
     return font
 
 
+@contextmanager
+def blocked_signals(*objs: QObject):
+    """QSignalBlocker for several objects at once; restores each one's previous state."""
+    previous = [o.blockSignals(True) for o in objs]
+    try:
+        yield
+    finally:
+        for o, was_blocked in zip(objs, previous):
+            o.blockSignals(was_blocked)
+
+
+def _color_field(hex_str: str):
+    """Dataclass field whose default is one shared QColor (Prefs colors are replaced, never mutated)."""
+    shared = QColor(hex_str)
+    return field(default_factory=lambda: shared, metadata={"hex": hex_str})
+
+
 @dataclass
 class Prefs:
     # Timeline / grid
-    day_background: QColor = field(default_factory=lambda: QColor("#F8F9FB"))
-    hour_line: QColor = field(default_factory=lambda: QColor("#C8CDD4"))
-    halfhour_line: QColor = field(default_factory=lambda: QColor("#DCE0E6"))
-    gutter_text: QColor = field(default_factory=lambda: QColor("#787C82"))
-    gutter_minor_text: QColor = field(default_factory=lambda: QColor("#9AA0A6"))
-    snap_text: QColor = field(default_factory=lambda: QColor("#82878C"))
+    day_background: QColor = _color_field("#F8F9FB")
+    hour_line: QColor = _color_field("#C8CDD4")
+    halfhour_line: QColor = _color_field("#DCE0E6")
+    gutter_text: QColor = _color_field("#787C82")
+    gutter_minor_text: QColor = _color_field("#9AA0A6")
+    snap_text: QColor = _color_field("#82878C")
     # Zebra hours
-    zebra_even: QColor = field(default_factory=lambda: QColor("#FFFFFF"))
-    zebra_odd:  QColor = field(default_factory=lambda: QColor("#F3F5FA"))
+    zebra_even: QColor = _color_field("#FFFFFF")
+    zebra_odd:  QColor = _color_field("#F3F5FA")
     # Now line + box
-    now_line: QColor = field(default_factory=lambda: QColor("#FF3B30"))
-    now_box_fill: QColor = field(default_factory=lambda: QColor("#FFF2F2"))
-    now_box_text: QColor = field(default_factory=lambda: QColor("#FF3B30"))
-    now_box_border: QColor = field(default_factory=lambda: QColor("#FF3B30"))
+    now_line: QColor = _color_field("#FF3B30")
+    now_box_fill: QColor = _color_field("#FFF2F2")
+    now_box_text: QColor = _color_field("#FF3B30")
+    now_box_border: QColor = _color_field("#FF3B30")
     # Events
-    event_default: QColor = field(default_factory=lambda: QColor("#4879C5"))
-    event_border:  QColor = field(default_factory=lambda: QColor("#1E1E1E"))
-    header_text:  QColor = field(default_factory=lambda: QColor("#FFFFFF"))
-    upcoming_bar: QColor = field(default_factory=lambda: QColor("#FF9F0A"))
-    upcoming_bar_bg: QColor = field(default_factory=lambda: QColor("#FFF7E6"))
+    event_default: QColor = _color_field("#4879C5")
+    event_border:  QColor = _color_field("#1E1E1E")
+    header_text:  QColor = _color_field("#FFFFFF")
+    upcoming_bar: QColor = _color_field("#FF9F0A")
+    upcoming_bar_bg: QColor = _color_field("#FFF7E6")
     upcoming_bar_bg_opacity: int = 40  # percent 0-100
     # Mini calendar
-    cal_today_dot: QColor = field(default_factory=lambda: QColor("#34C759"))   # Apple green
-    cal_selected_ring: QColor = field(default_factory=lambda: QColor("#007AFF"))  # iOS blue
+    cal_today_dot: QColor = _color_field("#34C759")   # Apple green
+    cal_selected_ring: QColor = _color_field("#007AFF")  # iOS blue
     # UI options
     time_24h: bool = True
     zoom_percent: int = 100
@@ -163,28 +384,23 @@ class Prefs:
     magnetic_mode: bool = False
     notify_sound_path: str = ""
 
+    # (color field, fallback hex) in pref.ini [colors] order; plain class attrs, not dataclass fields,
+    # filled in from the _color_field declarations right after the class
+    _COLOR_DEFAULTS = ()
+    _COLOR_KEYS = frozenset()
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in self._COLOR_KEYS:
+            object.__setattr__(self, "_color_dict_cache", None)
+
     def as_color_dict(self) -> Dict[str, str]:
-        return {
-            "day_background": qcolor_to_hex(self.day_background),
-            "hour_line": qcolor_to_hex(self.hour_line),
-            "halfhour_line": qcolor_to_hex(self.halfhour_line),
-            "gutter_text": qcolor_to_hex(self.gutter_text),
-            "gutter_minor_text": qcolor_to_hex(self.gutter_minor_text),
-            "snap_text": qcolor_to_hex(self.snap_text),
-            "zebra_even": qcolor_to_hex(self.zebra_even),
-            "zebra_odd":  qcolor_to_hex(self.zebra_odd),
-            "now_line": qcolor_to_hex(self.now_line),
-            "now_box_fill": qcolor_to_hex(self.now_box_fill),
-            "now_box_text": qcolor_to_hex(self.now_box_text),
-            "now_box_border": qcolor_to_hex(self.now_box_border),
-            "event_default": qcolor_to_hex(self.event_default),
-            "event_border":  qcolor_to_hex(self.event_border),
-            "header_text":   qcolor_to_hex(self.header_text),
-            "upcoming_bar":  qcolor_to_hex(self.upcoming_bar),
-            "upcoming_bar_bg": qcolor_to_hex(self.upcoming_bar_bg),
-            "cal_today_dot": qcolor_to_hex(self.cal_today_dot),
-            "cal_selected_ring": qcolor_to_hex(self.cal_selected_ring),
-        }
+        cached = self.__dict__.get("_color_dict_cache")
+        if cached is None:
+            cached = {k: qcolor_to_hex(getattr(self, k)) for k, _ in self._COLOR_DEFAULTS}
+            object.__setattr__(self, "_color_dict_cache", cached)
+        # callers (e.g. PreferencesDialog) edit the result, so never hand out the cache itself
+        return dict(cached)
 
     def as_ui_dict(self) -> Dict[str, str]:
         return {
@@ -200,17 +416,21 @@ class Prefs:
 
     @classmethod
     def from_config(cls, path: Path) -> "Prefs":
-        cfg = configparser.ConfigParser()
         if not path.exists():
             p = cls()
             p.save(path)
             return p
-        cfg.read(path)
-        sec = cfg["colors"] if "colors" in cfg else {}
-        ui  = cfg["ui"]     if "ui"     in cfg else {}
-
-        def get_color(name: str, default_hex: str) -> QColor:
-            return hex_to_qcolor(sec.get(name, default_hex), default_hex)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = _PREFS_CACHE.get(path)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            # callers mutate their Prefs, so hand out a copy and keep the cached one pristine
+            return replace(cached[1])
+        cfg = _fast_ini_read(path)
+        sec = cfg.get("colors", {})
+        ui  = cfg.get("ui", {})
 
         def get_bool(key: str, default: bool) -> bool:
             raw = ui.get(key, "1" if default else "0").strip().lower()
@@ -228,26 +448,9 @@ class Prefs:
         if size_minutes <= 0:
             size_minutes = get_int("time_snap_minutes", 30)
 
-        return cls(
-            day_background=get_color("day_background", "#F8F9FB"),
-            hour_line=get_color("hour_line", "#C8CDD4"),
-            halfhour_line=get_color("halfhour_line", "#DCE0E6"),
-            gutter_text=get_color("gutter_text", "#787C82"),
-            gutter_minor_text=get_color("gutter_minor_text", "#9AA0A6"),
-            snap_text=get_color("snap_text", "#82878C"),
-            zebra_even=get_color("zebra_even", "#FFFFFF"),
-            zebra_odd=get_color("zebra_odd",  "#F3F5FA"),
-            now_line=get_color("now_line", "#FF3B30"),
-            now_box_fill=get_color("now_box_fill", "#FFF2F2"),
-            now_box_text=get_color("now_box_text", "#FF3B30"),
-            now_box_border=get_color("now_box_border", "#FF3B30"),
-            event_default=get_color("event_default", "#4879C5"),
-            event_border=get_color("event_border", "#1E1E1E"),
-            header_text=get_color("header_text", "#FFFFFF"),
-            upcoming_bar=get_color("upcoming_bar", "#FF9F0A"),
-            upcoming_bar_bg=get_color("upcoming_bar_bg", "#FFF7E6"),
-            cal_today_dot=get_color("cal_today_dot", "#34C759"),
-            cal_selected_ring=get_color("cal_selected_ring", "#007AFF"),
+        colors = {name: hex_to_qcolor(sec.get(name, d), d) for name, d in cls._COLOR_DEFAULTS}
+        prefs = cls(
+            **colors,
             time_24h=get_bool("time_24h", True),
             zoom_percent=max(50, min(500, get_int("zoom_percent", 100))),
             upcoming_bar_bg_opacity=max(0, min(100, get_int("upcoming_bar_bg_opacity", 40))),
@@ -257,13 +460,27 @@ class Prefs:
             smart_scale_enabled=get_bool("smart_scale_enabled", False),
             magnetic_mode=get_bool("magnetic_mode", False),
         )
+        if mtime is not None:
+            _PREFS_CACHE[path] = (mtime, replace(prefs))
+        return prefs
 
     def save(self, path: Path):
         cfg = configparser.ConfigParser()
         cfg["colors"] = self.as_color_dict()
         cfg["ui"] = self.as_ui_dict()
+        buf = io.StringIO()
+        cfg.write(buf)
         with path.open("w", encoding="utf-8") as f:
-            cfg.write(f)
+            f.write(buf.getvalue())  # one write instead of ConfigParser's per-key writes
+        try:
+            _PREFS_CACHE[path] = (path.stat().st_mtime_ns, replace(self))
+        except OSError:
+            _PREFS_CACHE.pop(path, None)
+
+
+# Each color default lives only in its _color_field declaration
+Prefs._COLOR_DEFAULTS = tuple((f.name, f.metadata["hex"]) for f in fields(Prefs) if "hex" in f.metadata)
+Prefs._COLOR_KEYS = frozenset(k for k, _ in Prefs._COLOR_DEFAULTS)
 
 
 class PreferencesDialog(QDialog):
@@ -328,8 +545,10 @@ class PreferencesDialog(QDialog):
                 grid.addWidget(QLabel(label + ":"), row, 0)
                 swatch = QLabel()
                 swatch.setFixedSize(22, 22)
-                swatch.setStyleSheet(f"border:1px solid #888; background:{self._values[key]};")
+                swatch.setFrameShape(QFrame.Shape.Box)
+                swatch.setAutoFillBackground(True)
                 self.swatches[key] = swatch
+                self._set_swatch_color(key, self._values[key])
                 grid.addWidget(swatch, row, 1)
                 b = QPushButton(self._values[key])
                 b.clicked.connect(lambda _, k=key: self.pick(k))
@@ -375,13 +594,19 @@ class PreferencesDialog(QDialog):
 
     def pick(self, key: str):
         start = hex_to_qcolor(self._values[key], self._values[key])
-        from PySide6.QtWidgets import QColorDialog
         c = QColorDialog.getColor(start, self, f"Pick color for {key}")
         if c.isValid():
             hexv = qcolor_to_hex(c)
             self._values[key] = hexv
             self.btns[key].setText(hexv)
-            self.swatches[key].setStyleSheet(f"border:1px solid #888; background:{hexv};")
+            self._set_swatch_color(key, hexv)
+
+    def _set_swatch_color(self, key: str, hexv: str):
+        # Palette poke instead of setStyleSheet: no per-update CSS parse
+        swatch = self.swatches[key]
+        pal = swatch.palette()
+        pal.setColor(QPalette.ColorRole.Window, hex_to_qcolor(hexv, hexv))
+        swatch.setPalette(pal)
 
     def pick_notify_sound(self):
         fp, _ = QFileDialog.getOpenFileName(self, "Choose MP3", str(APP_DIR), "Audio Files (*.mp3)")
@@ -404,36 +629,53 @@ class PreferencesDialog(QDialog):
             QMessageBox.information(self, "Notification Test", "Unable to trigger notification from here.")
 
     def result_prefs(self) -> Prefs:
-        g = lambda k, d: hex_to_qcolor(self._values.get(k, d), d)
         opacity = self._upcoming_bg_opacity
         if self.upcoming_opacity_spin is not None:
             opacity = int(self.upcoming_opacity_spin.value())
         opacity = max(0, min(100, opacity))
-        new_prefs = replace(self._orig_prefs)
-        new_prefs.day_background = g("day_background", "#F8F9FB")
-        new_prefs.hour_line = g("hour_line", "#C8CDD4")
-        new_prefs.halfhour_line = g("halfhour_line", "#DCE0E6")
-        new_prefs.gutter_text = g("gutter_text", "#787C82")
-        new_prefs.gutter_minor_text = g("gutter_minor_text", "#9AA0A6")
-        new_prefs.snap_text = g("snap_text", "#82878C")
-        new_prefs.zebra_even = g("zebra_even", "#FFFFFF")
-        new_prefs.zebra_odd = g("zebra_odd",  "#F3F5FA")
-        new_prefs.now_line = g("now_line", "#FF3B30")
-        new_prefs.now_box_fill = g("now_box_fill", "#FFF2F2")
-        new_prefs.now_box_text = g("now_box_text", "#FF3B30")
-        new_prefs.now_box_border = g("now_box_border", "#FF3B30")
-        new_prefs.event_default = g("event_default", "#4879C5")
-        new_prefs.event_border = g("event_border", "#1E1E1E")
-        new_prefs.header_text = g("header_text", "#FFFFFF")
-        new_prefs.upcoming_bar = g("upcoming_bar", "#FF9F0A")
-        new_prefs.upcoming_bar_bg = g("upcoming_bar_bg", "#FFF7E6")
-        new_prefs.upcoming_bar_bg_opacity = opacity
-        new_prefs.cal_today_dot = g("cal_today_dot", "#34C759")
-        new_prefs.cal_selected_ring = g("cal_selected_ring", "#007AFF")
-        new_prefs.time_24h = self._time_24h
-        new_prefs.zoom_percent = self._zoom_percent
-        new_prefs.notify_sound_path = self._notify_sound_path
-        return new_prefs
+        colors = {k: hex_to_qcolor(self._values.get(k, d), d) for k, d in Prefs._COLOR_DEFAULTS}
+        return replace(
+            self._orig_prefs,
+            **colors,
+            upcoming_bar_bg_opacity=opacity,
+            time_24h=self._time_24h,
+            zoom_percent=self._zoom_percent,
+            notify_sound_path=self._notify_sound_path,
+        )
+
+
+class HistorySnapshot:
+    """One undo/redo step: a private copy of a day's events and the action that produced it."""
+    __slots__ = ("date", "events", "action", "timestamp", "_fingerprint", "_events_json")
+
+    def __init__(self, date: str, events: List[dict], action: str = "", timestamp: str = ""):
+        self.date = date
+        self.events = events
+        self.action = action
+        self.timestamp = timestamp
+        self._fingerprint: Optional[int] = None
+        self._events_json: Optional[str] = None
+
+    def events_json(self) -> str:
+        """`events` as history.csv stores them, serialized once however often the file is compacted."""
+        if self._events_json is None:
+            self._events_json = _dumps_compact(self.events)
+        return self._events_json
+
+    def fingerprint(self) -> int:
+        """Order-of-keys-insensitive hash of `events`, computed once (snapshots are never mutated)."""
+        if self._fingerprint is None:
+            self._fingerprint = hash(tuple(frozenset(it.items()) for it in self.events))
+        return self._fingerprint
+
+    def same_events(self, other: "HistorySnapshot") -> bool:
+        # unequal fingerprints settle most checks; equal ones are confirmed against real collisions
+        return self.fingerprint() == other.fingerprint() and self.events == other.events
+
+    def as_entry(self, index: int) -> dict:
+        """Row for HistoryDialog / history.csv, tagged with its position in MainWindow._history."""
+        return {"date": self.date, "events": self.events, "action": self.action,
+                "timestamp": self.timestamp, "_history_index": index}
 
 
 class HistoryDialog(QDialog):
@@ -466,11 +708,13 @@ class HistoryDialog(QDialog):
         layout.addWidget(buttons)
 
     def _rebuild_list(self):
-        self.list_widget.clear()
+        lw = self.list_widget
+        total = len(self._entries)
+        items: List[QListWidgetItem] = []
         for idx, entry in enumerate(reversed(self._entries)):
             real_index = entry.get("_history_index")
             if real_index is None:
-                real_index = len(self._entries) - 1 - idx
+                real_index = total - 1 - idx
             timestamp = entry.get("timestamp") or ""
             action = entry.get("action") or "Change"
             date = entry.get("date") or ""
@@ -479,10 +723,20 @@ class HistoryDialog(QDialog):
                 text += f" ({date})"
             item = QListWidgetItem(text)
             item.setData(Qt.ItemDataRole.UserRole, real_index)
-            self.list_widget.addItem(item)
+            items.append(item)
+        # One relayout/repaint for the whole list instead of one per addItem
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            lw.clear()
+            for item in items:
+                lw.addItem(item)
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
         self.restore_btn = getattr(self, "restore_btn", None)
         if self.restore_btn is not None:
-            self.restore_btn.setEnabled(False)
+            self._on_selection_changed()
 
     def _on_selection_changed(self):
         has_selection = bool(self.list_widget.selectedItems())
@@ -511,9 +765,11 @@ class WeeklyPatternPanel(QWidget):
         v = QVBoxLayout(self)
         grid = QGridLayout()
         self.checks: Dict[int, QCheckBox] = {}
+        self._mask = 0  # bit d set <=> ISO weekday d (1=Mon..7=Sun) is checked
         names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
         for i, name in enumerate(names, start=1):
             cb = QCheckBox(name)
+            cb.toggled.connect(lambda on, d=i: self._set_day(d, on))
             self.checks[i] = cb
             grid.addWidget(cb, 0 if i <= 4 else 1, (i - 1) % 4)
         v.addLayout(grid)
@@ -522,7 +778,10 @@ class WeeklyPatternPanel(QWidget):
         self.spin = QSpinBox(); self.spin.setRange(1, 52); self.spin.setValue(4)
         row.addWidget(self.spin); row.addStretch(1)
         v.addLayout(row)
-    def weekdays(self) -> List[int]: return [d for d, cb in self.checks.items() if cb.isChecked()]
+    def _set_day(self, day: int, on: bool):
+        if on: self._mask |= 1 << day
+        else: self._mask &= ~(1 << day)
+    def weekdays(self) -> List[int]: return [d for d in range(1, 8) if self._mask >> d & 1]
     def weeks(self) -> int: return int(self.spin.value())
 
 
@@ -538,6 +797,7 @@ class EventEditDialog(QDialog):
         self._time_24h = time_24h
         self._color_hex = color_hex
         self._image_rel = image_rel  # "uploads/uuid.png" or None
+        self._last_rendered_rel: object = object()  # sentinel: nothing rendered yet
         self._notify_offset = max(0, int(notify_offset or 0))
         cleaned_tags: List[str] = []
         if existing_tags:
@@ -548,7 +808,7 @@ class EventEditDialog(QDialog):
                     continue
                 seen.add(t_clean)
                 cleaned_tags.append(t_clean)
-        self._existing_tags = sorted(cleaned_tags, key=lambda s: s.lower())
+        self._existing_tags = sorted(cleaned_tags, key=str.lower)
         self._tag_placeholder = "Choose existing tag…"
         self._tag_combo: Optional[QComboBox] = None
         self._notifications_enabled = bool(notifications_enabled)
@@ -588,8 +848,8 @@ class EventEditDialog(QDialog):
         # Color
         color_row = QHBoxLayout()
         color_row.addWidget(QLabel("Color:"))
-        from PySide6.QtWidgets import QColorDialog
         self.color_btn = QPushButton("Pick Color…")
+        self._color_btn_style: Optional[str] = None
         self.color_btn.clicked.connect(self.pick_color)
         self._update_color_button()
         color_row.addWidget(self.color_btn)
@@ -641,10 +901,11 @@ class EventEditDialog(QDialog):
         self.img_preview = QLabel(); self.img_preview.setFixedSize(96, 96)
         self.img_preview.setStyleSheet("background:#eee; border:1px solid #aaa;")
         self._refresh_preview()
-        btn_attach = QPushButton("Attach PNG…"); btn_attach.clicked.connect(self.attach_png)
+        self._png_task: Optional[PngSquareTask] = None
+        self.btn_attach = QPushButton("Attach PNG…"); self.btn_attach.clicked.connect(self.attach_png)
         btn_clear  = QPushButton("Clear image"); btn_clear.clicked.connect(self.clear_image)
         igrid.addWidget(self.img_preview, 0, 0, 2, 1)
-        igrid.addWidget(btn_attach, 0, 1)
+        igrid.addWidget(self.btn_attach, 0, 1)
         igrid.addWidget(btn_clear,  1, 1)
         v.addWidget(img_box)
 
@@ -663,18 +924,31 @@ class EventEditDialog(QDialog):
         # Buttons
         box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         box.accepted.connect(self.accept); box.rejected.connect(self.reject)
+        self._ok_btn = box.button(QDialogButtonBox.StandardButton.Ok)
         v.addWidget(box)
 
     def _refresh_preview(self):
+        if self._image_rel == self._last_rendered_rel:
+            return
+        self._last_rendered_rel = self._image_rel
         if self._image_rel:
-            p = QPixmap(str(APP_DIR / self._image_rel))
-            if not p.isNull():
-                self.img_preview.setPixmap(p.scaled(self.img_preview.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+            path = APP_DIR / self._image_rel
+            try:
+                key = (str(path), path.stat().st_mtime_ns)
+            except OSError:
+                key = None
+            thumb = _THUMB_CACHE.get(key) if key is not None else None
+            if thumb is None and key is not None:
+                p = QPixmap(str(path))
+                if not p.isNull():
+                    thumb = p.scaled(self.img_preview.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                    _THUMB_CACHE[key] = thumb
+            if thumb is not None:
+                self.img_preview.setPixmap(thumb)
                 return
         self.img_preview.setPixmap(QPixmap())
 
     def pick_color(self):
-        from PySide6.QtWidgets import QColorDialog
         start = hex_to_qcolor(self._color_hex, self._color_hex)
         c = QColorDialog.getColor(start, self, "Pick a color")
         if c.isValid():
@@ -686,25 +960,32 @@ class EventEditDialog(QDialog):
             return
         self.tag_edit.setText(text)
         if self._tag_combo is not None:
-            self._tag_combo.blockSignals(True)
-            self._tag_combo.setCurrentIndex(0)
-            self._tag_combo.blockSignals(False)
+            with QSignalBlocker(self._tag_combo):
+                self._tag_combo.setCurrentIndex(0)
 
     def _update_color_button(self):
-        color = hex_to_qcolor(self._color_hex, "#4879C5")
-        if not color.isValid():
-            color = QColor("#4879C5")
-        r, g, b = color.red(), color.green(), color.blue()
-        luminance = 0.299 * r + 0.587 * g + 0.114 * b
-        text_color = "#000000" if luminance > 186 else "#FFFFFF"
-        self.color_btn.setStyleSheet(
-            f"background-color: {qcolor_to_hex(color)}; color: {text_color}; padding:6px;"
-        )
+        style = _color_button_style(self._color_hex)
+        if style != self._color_btn_style:  # setStyleSheet re-parses CSS; only call it on change
+            self._color_btn_style = style
+            self.color_btn.setStyleSheet(style)
 
     def attach_png(self):
         fp, _ = QFileDialog.getOpenFileName(self, "Choose PNG", str(APP_DIR), "PNG Images (*.png)")
         if not fp: return
-        rel = save_png_square_256(Path(fp))
+        # Crop/scale/encode off the GUI thread; keep a reference so the signaller outlives run()
+        task = PngSquareTask(Path(fp))
+        task.setAutoDelete(False)
+        task.signals.done.connect(self._on_png_ready, Qt.ConnectionType.QueuedConnection)
+        self._png_task = task
+        # OK waits for the conversion, otherwise the payload would miss the new image
+        self.btn_attach.setEnabled(False); self._ok_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_png_ready(self, rel: Optional[str]):
+        if self._png_task is None:  # dialog was cancelled meanwhile; reject() removed the file
+            return
+        self._png_task = None
+        self.btn_attach.setEnabled(True); self._ok_btn.setEnabled(True)
         if rel:
             self._image_rel = rel
             self._refresh_preview()
@@ -715,6 +996,18 @@ class EventEditDialog(QDialog):
         self._image_rel = None
         self._refresh_preview()
 
+    def reject(self):
+        task, self._png_task = self._png_task, None
+        if task is not None and not QThreadPool.globalInstance().tryTake(task):
+            # Already converting: let it finish, then drop the upload nothing will reference
+            rel = task.wait()
+            if rel:
+                try:
+                    (APP_DIR / rel).unlink()
+                except OSError:
+                    pass
+        super().reject()
+
     def result_payload(self) -> dict:
         s = self.start_edit.time(); e = self.end_edit.time()
         start_min = s.hour() * 60 + s.minute()
@@ -744,7 +1037,7 @@ class TagEditorDialog(QDialog):
         layout = QVBoxLayout(self)
         layout.addWidget(QLabel("Select a tag to remove it from every event."))
         self.list = QListWidget()
-        self.list.addItems(sorted(tags, key=lambda s: s.lower()))
+        self.list.addItems(sorted(tags, key=str.lower))
         self.list.currentRowChanged.connect(self._update_buttons)
         layout.addWidget(self.list)
         self.delete_btn = QPushButton("Delete selected tag")
@@ -788,7 +1081,7 @@ class TagEditorDialog(QDialog):
         self._update_buttons(self.list.currentRow())
 
     def removed_tags(self) -> List[str]:
-        return sorted(self._deleted, key=lambda s: s.lower())
+        return sorted(self._deleted, key=str.lower)
 
 class DayView(QWidget):
     gutter = 64
@@ -798,17 +1091,59 @@ class DayView(QWidget):
         super().__init__(parent)
         self.owner = None
         self.prefs = prefs or Prefs()
-        self.px_per_min = BASE_PX_PER_MIN * (float(self.prefs.zoom_percent) / 100.0)
+        self._set_px_per_min(BASE_PX_PER_MIN * (float(self.prefs.zoom_percent) / 100.0))
         self.time_size_minutes = max(1, int(getattr(self.prefs, "time_size_minutes", getattr(self.prefs, "time_snap_minutes", 30))))
         self.snap_enabled = bool(getattr(self.prefs, "time_snap_enabled", True))
         self.smart_scale_enabled = bool(getattr(self.prefs, "smart_scale_enabled", False))
         self.magnetic_mode = bool(getattr(self.prefs, "magnetic_mode", False))
+        self._time_24h = bool(self.prefs.time_24h)  # read by the time formatters on every label
+        self._label_cache: Dict[Tuple[int, bool], Tuple[str, ...]] = {}
         self.event_widgets: List[EventWidget] = []
+        # Interval index over event_widgets, sorted by start_min; rebuilt lazily when dirty.
+        # EventWidget.start_min/end_min setters and add/delete/clear flip the flag.
+        self._intervals_dirty = True
+        self._iv_events: List[EventWidget] = []
+        self._iv_starts: List[int] = []
+        self._iv_ends: List[int] = []
+        self._iv_max_end: List[int] = []  # running max of _iv_ends (prefix max)
+        self._iv_order: Dict[EventWidget, int] = {}
+        self._iv_by_end: List[int] = []
+        self._iv_end_edges: List[int] = []  # sorted end_min values, parallel to _iv_by_end
         self.setMinimumWidth(420); self.setMouseTracking(True)
         self._update_height()
         self.show_now_line = False
         self.upcoming_window_minutes = 6 * 60  # show countdown indicator for events within this window
         self._cached_indicator_state: Optional[dict] = None
+        self._rem_bucket = -1  # minute of day the cached "REM ..." strings were formatted for
+        self._rem_cache: Dict[int, str] = {}
+        self._grid_cache: Optional[QPixmap] = None
+        self._grid_cache_rect = QRect()
+        self._grid_cache_key: Optional[tuple] = None
+        self._rebuild_paint_cache()
+        # Drag/edit storms funnel through _schedule_update so at most one repaint is queued per frame.
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_scheduled_update)
+        self._dirty_region = QRegion()
+        self._dirty_full = False
+        # Mouse samples during a block drag; only the newest one queued per event-loop pass is applied.
+        self._pending_drag: Optional[Tuple[EventWidget, QPointF]] = None
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(0)
+        self._drag_timer.timeout.connect(self._flush_pending_drag)
+        # Toolbar toggles and zoom drags can change prefs many times a second; write pref.ini once it settles.
+        self._prefs_save_timer = QTimer(self)
+        self._prefs_save_timer.setSingleShot(True)
+        self._prefs_save_timer.setInterval(500)
+        self._prefs_save_timer.timeout.connect(self._write_prefs)
+        # The indicator changes at minute resolution; edits batch into one refresh on the next loop turn
+        # and the owner's minute tick calls refresh_indicator directly, so paints never recompute it.
+        self._indicator_refresh_timer = QTimer(self)
+        self._indicator_refresh_timer.setSingleShot(True)
+        self._indicator_refresh_timer.setInterval(0)
+        self._indicator_refresh_timer.timeout.connect(self.refresh_indicator)
         self.upcoming_indicator = UpcomingIndicator(self)
         self.upcoming_indicator.hide()
         self._layout_upcoming_indicator()
@@ -817,11 +1152,16 @@ class DayView(QWidget):
         self._box_select_origin: Optional[QPoint] = None
         self._box_rubber: Optional[QRubberBand] = None
         self._box_selected_widgets: Set['EventWidget'] = set()
+        self._transparent_widgets: Set['EventWidget'] = set()  # widgets currently WA_TransparentForMouseEvents
         self._group_move_active = False
         self._group_move_start_global = 0.0
         self._group_move_last_delta = 0
         self._group_move_refs: List[Tuple['EventWidget', int, int]] = []
         self._group_move_selected: Set['EventWidget'] = set()
+        # Snapshot taken at group-move start: selection bounds + sorted index of the
+        # unselected (stationary) events, so each drag tick is O(S log N).
+        self._group_move_span: Tuple[int, int] = (0, 0)
+        self._group_move_others: Tuple[List[int], List[int], List[int]] = ([], [], [])
 
     def note_history_action(self, action: str):
         owner = getattr(self, "owner", None)
@@ -830,23 +1170,33 @@ class DayView(QWidget):
 
     def minute_to_y(self, minute: int) -> int: return int(minute * self.px_per_min) + self.top_pad
     def y_to_minute(self, y: int) -> int:
-        m = int(round((y - self.top_pad) / self.px_per_min)); return max(0, min(24 * 60, m))
+        m = int(round((y - self.top_pad) / self.px_per_min))
+        return 0 if m < 0 else (MINUTES_PER_DAY if m > MINUTES_PER_DAY else m)
     def time_to_str(self, t: QTime) -> str:
-        if getattr(self.prefs, "time_24h", True): return f"{t.hour():02d}:{t.minute():02d}"
+        if self._time_24h: return f"{t.hour():02d}:{t.minute():02d}"
         suffix = "AM" if t.hour() < 12 else "PM"; h12 = t.hour() % 12 or 12; return f"{h12}:{t.minute():02d} {suffix}"
-    def min_to_hhmm(self, m: int) -> str:
-        h = m // 60; mi = m % 60
-        if getattr(self.prefs, "time_24h", True): return f"{h:02d}:{mi:02d}"
-        suffix = "AM" if h < 12 else "PM"; h12 = h % 12 or 12; return f"{h12}:{mi:02d} {suffix}"
-    def _grid_step_minutes(self) -> int:
-        for step in (5, 10, 15, 30, 60):
-            if step * self.px_per_min >= 14: return step
-        return 60
+    def min_to_hhmm(self, m: int) -> str: return _fmt_hhmm(m, self._time_24h)
+    def _labels_for(self, step: int) -> Tuple[str, ...]:
+        """Gutter labels for minutes 0, step, 2*step, ... 24h; keyed on (step, time_24h) so never stale."""
+        key = (step, self._time_24h)
+        labels = self._label_cache.get(key)
+        if labels is None:
+            labels = tuple(self.min_to_hhmm(m) for m in range(0, 24 * 60 + 1, step))
+            self._label_cache[key] = labels
+        return labels
+    def _set_px_per_min(self, px_per_min: float):
+        """Single writer for px_per_min; refreshes the zoom-derived step and snap thresholds."""
+        self.px_per_min = px_per_min
+        self._grid_step = next((step for step in (5, 10, 15, 30, 60) if step * px_per_min >= 14), 60)
+        self._snap_threshold = self._minutes_from_pixels(30.0)
+        self._now_snap_threshold = self._minutes_from_pixels(40.0)
+    def _grid_step_minutes(self) -> int: return self._grid_step
     def _update_height(self):
         total_px = int(24 * 60 * self.px_per_min) + self.top_pad + self.bottom_pad
         self.setFixedHeight(total_px)
         if hasattr(self, "upcoming_indicator"):
             self._layout_upcoming_indicator()
+            self._schedule_indicator_refresh()
 
     def _layout_upcoming_indicator(self):
         if not hasattr(self, "upcoming_indicator"):
@@ -856,26 +1206,132 @@ class DayView(QWidget):
         self.upcoming_indicator.setGeometry(int(x), 0, int(width), self.height())
         self.upcoming_indicator.raise_()
 
+    def _ensure_intervals(self):
+        if not self._intervals_dirty:
+            return
+        evs = sorted(self.event_widgets, key=lambda ev: ev.start_min)
+        ends = [ev.end_min for ev in evs]
+        self._iv_events = evs
+        self._iv_starts = [ev.start_min for ev in evs]
+        self._iv_ends = ends
+        self._iv_max_end = self._prefix_max(ends)
+        self._iv_order = {ev: i for i, ev in enumerate(self.event_widgets)}  # for event_widgets-order tie breaks
+        self._iv_by_end = sorted(range(len(evs)), key=ends.__getitem__)  # index positions ordered by end edge
+        self._iv_end_edges = [ends[j] for j in self._iv_by_end]
+        self._intervals_dirty = False
+
+    @staticmethod
+    def _prefix_max(values: List[int]) -> List[int]:
+        out: List[int] = []
+        running = -1
+        for v in values:
+            if v > running:
+                running = v
+            out.append(running)
+        return out
+
+    @staticmethod
+    def _sorted_hits(starts: List[int], ends: List[int], max_end: List[int], start_min: int, end_min: int) -> bool:
+        """True if any interval in the start-sorted lists intersects [start_min, end_min)."""
+        if end_min <= start_min:
+            return False
+        j = bisect_left(starts, end_min) - 1
+        while j >= 0 and max_end[j] > start_min:
+            if ends[j] > start_min:
+                return True
+            j -= 1
+        return False
+
+    def _earliest_conflict(self, start_min: int, end_min: int, excluded: Set['EventWidget']) -> Optional['EventWidget']:
+        """Earliest-starting widget outside `excluded` intersecting [start_min, end_min). O(log N + k)."""
+        if end_min <= start_min:
+            return None
+        self._ensure_intervals()
+        evs = self._iv_events; ends = self._iv_ends; max_end = self._iv_max_end
+        found = None
+        j = bisect_left(self._iv_starts, end_min) - 1
+        while j >= 0 and max_end[j] > start_min:
+            if ends[j] > start_min and evs[j] not in excluded:
+                found = evs[j]
+            j -= 1
+        return found
+
+    def _blocks_near(self, ends_near: Optional[int], starts_near: Optional[int], threshold: int) -> List['EventWidget']:
+        """Blocks ending within `threshold` of `ends_near` or starting within it of `starts_near`.
+
+        Returned in event_widgets order so snapping keeps its first-found tie break.
+        """
+        self._ensure_intervals()
+        evs, starts = self._iv_events, self._iv_starts
+        picked: Set[int] = set()
+        if ends_near is not None:
+            edges = self._iv_end_edges
+            picked.update(self._iv_by_end[bisect_left(edges, ends_near - threshold):
+                                          bisect_right(edges, ends_near + threshold)])
+        if starts_near is not None:
+            picked.update(range(bisect_left(starts, starts_near - threshold),
+                                bisect_right(starts, starts_near + threshold)))
+        order = self._iv_order
+        return sorted((evs[j] for j in picked), key=order.__getitem__)
+
+    def visible_blocks(self) -> List['EventWidget']:
+        """Blocks intersecting the part of the day scrolled into view, found through the interval index."""
+        vis = self.visibleRegion().boundingRect()
+        if vis.isEmpty():
+            return []
+        lo = self.y_to_minute(vis.top() - 10) - 1  # blocks are at least 10px tall
+        hi = self.y_to_minute(vis.bottom()) + 1
+        self._ensure_intervals()
+        evs, ends, max_end = self._iv_events, self._iv_ends, self._iv_max_end
+        out: List['EventWidget'] = []
+        j = bisect_left(self._iv_starts, hi) - 1
+        while j >= 0 and max_end[j] > lo:
+            if ends[j] > lo:
+                out.append(evs[j])
+            j -= 1
+        return out
+
+    def next_block_start_after(self, minute: int, exclude: Optional['EventWidget'] = None) -> int:
+        """Start of the first block (other than `exclude`) ending after `minute`, else midnight.
+
+        [minute, minute + d) is free exactly when d <= result - minute.
+        """
+        covering = self._earliest_conflict(minute, minute + 1, {exclude} if exclude is not None else set())
+        if covering is not None:
+            return covering.start_min
+        evs, starts, ends = self._iv_events, self._iv_starts, self._iv_ends
+        for j in range(bisect_left(starts, minute), len(evs)):
+            if evs[j] is not exclude and ends[j] > minute:
+                return starts[j]
+        return 24 * 60
+
+    def prev_block_end_before(self, minute: int, exclude: Optional['EventWidget'] = None) -> int:
+        """Latest end among blocks (other than `exclude`) starting before `minute`, else 0.
+
+        [minute - d, minute) is free exactly when d <= minute - result.
+        """
+        self._ensure_intervals()
+        evs, ends, max_end = self._iv_events, self._iv_ends, self._iv_max_end
+        best = 0
+        j = bisect_left(self._iv_starts, minute) - 1
+        while j >= 0 and max_end[j] > best:
+            if ends[j] > best and evs[j] is not exclude:
+                best = ends[j]
+            j -= 1
+        return best
+
     def _next_upcoming_start(self, current_min: int) -> Optional[int]:
-        next_start: Optional[int] = None
-        for ev in self.event_widgets:
-            if ev.start_min > current_min:
-                if next_start is None or ev.start_min < next_start:
-                    next_start = ev.start_min
-        return next_start
+        if self._intervals_dirty:
+            # Mid-drag the index is stale on every paint; one min() pass is cheaper
+            # than re-sorting, and the next structural query rebuilds it anyway.
+            return min((ev.start_min for ev in self.event_widgets if ev.start_min > current_min), default=None)
+        starts = self._iv_starts
+        idx = bisect_right(starts, current_min)
+        return starts[idx] if idx < len(starts) else None
 
     @staticmethod
     def _format_remaining_minutes(total_min: int) -> str:
-        total_min = max(0, total_min)
-        h, m = divmod(total_min, 60)
-        parts = []
-        if h:
-            parts.append(f"{h}h")
-        if m:
-            parts.append(f"{m}m")
-        if not parts:
-            parts.append("0m")
-        return " ".join(parts)
+        return _fmt_duration(total_min)
 
     def snap_step(self) -> int:
         return self.time_size_minutes if self.snap_enabled else 1
@@ -883,9 +1339,10 @@ class DayView(QWidget):
     def snap_minute(self, minute: int) -> int:
         step = self.snap_step()
         if step <= 1:
-            return max(0, min(24 * 60, int(minute)))
-        snapped = int(round(minute / step) * step)
-        return max(0, min(24 * 60, snapped))
+            snapped = int(minute)
+        else:
+            snapped = int(round(minute / step) * step)
+        return 0 if snapped < 0 else (MINUTES_PER_DAY if snapped > MINUTES_PER_DAY else snapped)
 
     def snap_delta(self, raw_minutes: float) -> int:
         step = self.snap_step()
@@ -896,14 +1353,14 @@ class DayView(QWidget):
     def _snap_minute_to_chunk(self, minute: int) -> int:
         chunk = max(1, self.time_size_minutes)
         snapped = int(round(minute / chunk) * chunk)
-        return max(0, min(24 * 60, snapped))
+        return 0 if snapped < 0 else (MINUTES_PER_DAY if snapped > MINUTES_PER_DAY else snapped)
 
     def _minutes_from_pixels(self, pixels: float) -> int:
         px = max(0.1, float(self.px_per_min))
         return max(1, int(round(pixels / px)))
 
     def _snap_threshold_minutes(self) -> int:
-        return self._minutes_from_pixels(30.0)
+        return self._snap_threshold
 
     def _current_time_minute(self) -> Optional[int]:
         if not self.show_now_line:
@@ -923,7 +1380,7 @@ class DayView(QWidget):
         if now_min is None:
             return None
         diff = abs(start_min - now_min)
-        threshold = self._minutes_from_pixels(40.0)
+        threshold = self._now_snap_threshold
         if diff > threshold:
             return None
         candidate_start = now_min
@@ -950,7 +1407,9 @@ class DayView(QWidget):
         original_end = block.end_min
         best: Optional[Tuple[int, int, int]] = None  # (start, end, diff)
 
-        for ev in self.event_widgets:
+        near = self._blocks_near(block.start_min if allow_start else None,
+                                 block.end_min if allow_end else None, threshold)
+        for ev in near:
             if ev is block:
                 continue
             if allow_start:
@@ -1003,7 +1462,7 @@ class DayView(QWidget):
         best_start = start_min
         best_diff: Optional[int] = None
 
-        for ev in self.event_widgets:
+        for ev in self._blocks_near(start_min, start_min + duration, threshold):
             # Snap to block above (new block immediately below existing)
             candidate_start = ev.end_min
             diff = abs(start_min - candidate_start)
@@ -1033,15 +1492,16 @@ class DayView(QWidget):
         if exclude is not None:
             excluded.add(exclude)
 
+        if direction > 0:
+            swept = self._sweep_forward(start, duration, excluded)
+            if swept is not None:
+                return swept
+            # pushed past the end of the day: clamp and let the loop below settle it
+            start = 24 * 60 - duration
+
         max_iters = len(self.event_widgets) + 1
         for _ in range(max_iters):
-            conflict = None
-            for ev in self.event_widgets:
-                if ev in excluded:
-                    continue
-                if max(start, ev.start_min) < min(start + duration, ev.end_min):
-                    conflict = ev
-                    break
+            conflict = self._earliest_conflict(start, start + duration, excluded)
             if conflict is None:
                 return start
 
@@ -1066,6 +1526,25 @@ class DayView(QWidget):
             start = max(0, min(start, 24 * 60 - duration))
         return None
 
+    def _sweep_forward(self, start: int, duration: int, excluded: Set['EventWidget']) -> Optional[int]:
+        """Push `start` past each earliest-starting conflict in one pass over the index.
+
+        Returns the first free start, or None if that would run past the end of the day.
+        """
+        self._ensure_intervals()
+        evs, starts, ends = self._iv_events, self._iv_starts, self._iv_ends
+        latest = 24 * 60 - duration
+        # everything before this index ends at or before `start` (prefix max is non-decreasing)
+        for j in range(bisect_right(self._iv_max_end, start), len(evs)):
+            if starts[j] >= start + duration:
+                break
+            if ends[j] <= start or evs[j] in excluded:
+                continue
+            start = ends[j]
+            if start > latest:
+                return None
+        return start
+
     def _compute_indicator_state(self, current_min: int) -> Optional[dict]:
         if not self.show_now_line:
             return None
@@ -1089,79 +1568,196 @@ class DayView(QWidget):
             "text": f"Time left {self._format_remaining_minutes(diff_min)} ⏰",
         }
 
+    def _remaining_text(self, start_min: int, end_min: int) -> str:
+        """"REM 1h 5m" for a block in progress now, else ""; memoized per end_min within the current minute."""
+        now = QTime.currentTime()
+        current_min = now.hour() * 60 + now.minute()
+        if not (start_min <= current_min < end_min):
+            return ""
+        if current_min != self._rem_bucket:
+            self._rem_bucket = current_min
+            self._rem_cache.clear()
+        text = self._rem_cache.get(end_min)
+        if text is None:
+            text = f"REM {_fmt_duration(end_min - current_min)}"
+            self._rem_cache[end_min] = text
+        return text
+
+    def _schedule_indicator_refresh(self):
+        if not self._indicator_refresh_timer.isActive():
+            self._indicator_refresh_timer.start()
+
+    def refresh_indicator(self):
+        """Recompute the upcoming-event indicator now (also drops any pending scheduled refresh)."""
+        self._indicator_refresh_timer.stop()
+        state: Optional[dict] = None
+        if self.show_now_line:
+            now = QTime.currentTime()
+            state = self._compute_indicator_state(now.hour() * 60 + now.minute())
+        should_show = state is not None
+        if state == self._cached_indicator_state and self.upcoming_indicator.isVisible() == should_show:
+            return
+        self._cached_indicator_state = state
+        self.upcoming_indicator.set_state(state)
+        self.upcoming_indicator.setVisible(should_show)
+        if should_show:
+            self._layout_upcoming_indicator()
+            self.upcoming_indicator.raise_()
+
     def overlaps_range(self, start_min: int, end_min: int,
                        exclude: Optional['EventWidget']=None,
                        exclude_set: Optional[Set['EventWidget']]=None) -> bool:
-        for ev in self.event_widgets:
-            if ev is exclude:
-                continue
-            if exclude_set and ev in exclude_set:
-                continue
-            if max(start_min, ev.start_min) < min(end_min, ev.end_min):
-                return True
+        if end_min <= start_min:
+            return False
+        self._ensure_intervals()
+        if exclude is None and not exclude_set:
+            return self._sorted_hits(self._iv_starts, self._iv_ends, self._iv_max_end, start_min, end_min)
+        evs = self._iv_events; ends = self._iv_ends; max_end = self._iv_max_end
+        j = bisect_left(self._iv_starts, end_min) - 1
+        while j >= 0 and max_end[j] > start_min:
+            if ends[j] > start_min:
+                ev = evs[j]
+                if ev is not exclude and not (exclude_set and ev in exclude_set):
+                    return True
+            j -= 1
         return False
 
-    def paintEvent(self, event):
-        p = QPainter(self)
-        p.fillRect(self.rect(), self.prefs.day_background)
-
+    def _rebuild_paint_cache(self):
+        """Pens/fonts/brushes used by paintEvent; rebuilt whenever prefs are (re)applied."""
+        prefs = self.prefs
+        self._pen_hour = QPen(prefs.hour_line, 2)
+        self._pen_half = QPen(prefs.halfhour_line, 1)
+        self._pen_gutter_major = QPen(prefs.gutter_text)
+        self._pen_gutter_minor = QPen(prefs.gutter_minor_text)
+        self._pen_snap = QPen(prefs.snap_text)
+        self._pen_now = QPen(prefs.now_line, 2)
+        self._pen_nowbox_border = QPen(prefs.now_box_border, 1)
+        self._pen_nowbox_text = QPen(prefs.now_box_text)
+        self._brush_nowbox = QBrush(prefs.now_box_fill)
+        self._font_label_9 = make_ui_font(9)
+        self._font_label_8 = make_ui_font(8)
+        self._font_nowbox = make_ui_font(9, QFont.Weight.Medium)
+        self._fm_nowbox = QFontMetrics(self._font_nowbox)
+        self._nowbox_h = self._fm_nowbox.height() + 8  # text plus 4px top/bottom padding; also sizes update_now_band
+        # keyed by (text, dpr) -> (pixmap, box w, box h) in logical px; colors fixed per prefs
+        self._nowbox_cache: Dict[Tuple[str, float], Tuple[QPixmap, int, int]] = {}
+
+    def _grid_key(self) -> tuple:
+        prefs = self.prefs
+        colors = (prefs.day_background, prefs.zebra_even, prefs.zebra_odd, prefs.hour_line,
+                  prefs.halfhour_line, prefs.gutter_text, prefs.gutter_minor_text)
+        return (self.width(), self.px_per_min, self._time_24h, self.devicePixelRatioF(),
+                tuple(c.rgba() for c in colors))
+
+    def _render_grid_pixmap(self, area: QRect) -> QPixmap:
+        """Background, zebra hours, grid lines and gutter labels for `area` (widget coords)."""
+        dpr = self.devicePixelRatioF()
+        pm = QPixmap(max(1, int(area.width() * dpr)), max(1, int(area.height() * dpr)))
+        pm.setDevicePixelRatio(dpr)
+        prefs = self.prefs
+        pm.fill(prefs.day_background)
+        p = QPainter(pm)
+        p.translate(-area.x(), -area.y())
+
+        px_per_min = self.px_per_min; top_pad = self.top_pad
+        area_top = area.top(); area_bottom = area.bottom()
         width_right = self.width() - 8
         band_left = self.gutter
+        zebra = (prefs.zebra_even, prefs.zebra_odd)
         for hour in range(24):
-            y0 = self.minute_to_y(hour*60); y1 = self.minute_to_y(hour*60+60)
-            color = self.prefs.zebra_even if (hour % 2 == 0) else self.prefs.zebra_odd
-            p.fillRect(QRect(band_left, y0, max(0, width_right - band_left), max(0, y1 - y0)), color)
+            y0 = int(hour * 60 * px_per_min) + top_pad; y1 = int((hour * 60 + 60) * px_per_min) + top_pad
+            if y1 < area_top or y0 > area_bottom:
+                continue
+            p.fillRect(QRect(band_left, y0, max(0, width_right - band_left), max(0, y1 - y0)), zebra[hour % 2])
 
         step = self._grid_step_minutes()
-        for minute in range(0, 24 * 60 + 1, step):
-            y = self.minute_to_y(minute)
-            is_hour = (minute % 60 == 0)
-            pen = QPen(self.prefs.hour_line if is_hour else self.prefs.halfhour_line); pen.setWidth(2 if is_hour else 1)
-            p.setPen(pen); p.drawLine(self.gutter, y, self.width() - 8, y)
-            if is_hour:
-                p.setPen(QPen(self.prefs.gutter_text)); p.setFont(make_ui_font(9))
-                p.drawText(8, y + 4, self.min_to_hhmm(minute))
+        # one step of slack either side so labels straddling the area edge are still drawn
+        first = max(0, (self.y_to_minute(area_top) // step - 1) * step)
+        last = min(24 * 60, self.y_to_minute(area_bottom) + step)
+        pen_hour = self._pen_hour; pen_half = self._pen_half
+        pen_major = self._pen_gutter_major; pen_minor = self._pen_gutter_minor
+        font_major = self._font_label_9; font_minor = self._font_label_8
+        labels = self._labels_for(step)
+        for minute in range(first, last + 1, step):
+            y = int(minute * px_per_min) + top_pad
+            if minute % 60 == 0:
+                p.setPen(pen_hour); p.drawLine(band_left, y, width_right, y)
+                p.setPen(pen_major); p.setFont(font_major)
+                p.drawText(8, y + 4, labels[minute // step])
             else:
-                p.setPen(QPen(self.prefs.gutter_minor_text)); p.setFont(make_ui_font(8))
-                p.drawText(8, y + 3, self.min_to_hhmm(minute))
+                p.setPen(pen_half); p.drawLine(band_left, y, width_right, y)
+                p.setPen(pen_minor); p.setFont(font_minor)
+                p.drawText(8, y + 3, labels[minute // step])
+        p.end()
+        return pm
+
+    def _nowbox_pixmap(self, txt: str) -> Tuple[QPixmap, int, int]:
+        """Antialiased now-box (rounded rect + time) with a 1px margin for the border stroke, plus its box size."""
+        dpr = self.devicePixelRatioF()
+        key = (txt, dpr)
+        hit = self._nowbox_cache.get(key)
+        if hit is not None:
+            return hit
+        pad_x = 8; rect_w = self._fm_nowbox.horizontalAdvance(txt) + pad_x*2; rect_h = self._nowbox_h
+        pm = QPixmap(int((rect_w + 2) * dpr), int((rect_h + 2) * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        p.setFont(self._font_nowbox)
+        rect = QRect(1, 1, rect_w, rect_h)
+        p.setPen(self._pen_nowbox_border); p.setBrush(self._brush_nowbox)
+        p.drawRoundedRect(rect, 8, 8)
+        p.setPen(self._pen_nowbox_text); p.drawText(rect, Qt.AlignmentFlag.AlignCenter, txt)
+        p.end()
+        if len(self._nowbox_cache) >= 4:
+            self._nowbox_cache.pop(next(iter(self._nowbox_cache)))
+        hit = self._nowbox_cache[key] = (pm, rect_w, rect_h)
+        return hit
+
+    def update_now_band(self, *minutes: int):
+        """Repaint only the strips the now-line and its time box cover at each of `minutes`."""
+        half = self._nowbox_h // 2 + 2  # box height/2 plus border stroke and rounding
+        w = self.width()
+        for m in minutes:
+            self.update(0, self.minute_to_y(m) - half, w, 2 * half + 1)
 
-        p.setPen(QPen(self.prefs.snap_text)); p.setFont(make_ui_font(8))
+    def paintEvent(self, event):
+        p = QPainter(self)
+        # The day is up to ~21k px tall, so cache only the visible band rather than the whole grid;
+        # drags and now-line ticks then repaint from one blit.
+        area = event.rect()
+        key = self._grid_key()
+        if (self._grid_cache is None or key != self._grid_cache_key
+                or not self._grid_cache_rect.contains(area)):
+            visible = self.visibleRegion().boundingRect()
+            target = area.united(visible) if not visible.isEmpty() else area
+            self._grid_cache = self._render_grid_pixmap(target)
+            self._grid_cache_rect = target
+            self._grid_cache_key = key
+        p.drawPixmap(self._grid_cache_rect.topLeft(), self._grid_cache)
+
+        p.setPen(self._pen_snap); p.setFont(self._font_label_8)
         size_text = f"{self.time_size_minutes} min"
         snap_text = "On" if self.snap_enabled else "Off"
         p.drawText(self.width() - 260, 12, f"Time Size: {size_text}  |  Snap: {snap_text}  |  Zoom: {int(self.px_per_min/BASE_PX_PER_MIN*100)}%")
 
-        indicator_state: Optional[dict] = None
         if self.show_now_line:
             now = QTime.currentTime()
             m = now.hour()*60 + now.minute()
             y = self.minute_to_y(m)
-            p.setPen(QPen(self.prefs.now_line, 2)); p.drawLine(self.gutter, y, self.width() - 8, y)
-            p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-            box_font = make_ui_font(9, QFont.Weight.Medium); p.setFont(box_font)
-            txt = self.time_to_str(now); fm = QFontMetrics(box_font)
-            pad_x, pad_y = 8, 4; rect_w = fm.horizontalAdvance(txt)+pad_x*2; rect_h = fm.height()+pad_y*2
+            p.setPen(self._pen_now); p.drawLine(self.gutter, y, self.width() - 8, y)
+            txt = self.time_to_str(now)
+            box, rect_w, rect_h = self._nowbox_pixmap(txt)
             usable_left = self.gutter; usable_right = self.width() - 8
             rect_x = int(usable_left + (usable_right-usable_left)//2 - rect_w/2); rect_y = int(y - rect_h/2)
-            p.setPen(QPen(self.prefs.now_box_border, 1)); p.setBrush(QBrush(self.prefs.now_box_fill))
-            p.drawRoundedRect(QRect(rect_x, rect_y, rect_w, rect_h), 8, 8)
-            p.setPen(QPen(self.prefs.now_box_text)); p.drawText(QRect(rect_x, rect_y, rect_w, rect_h), Qt.AlignmentFlag.AlignCenter, txt)
-            indicator_state = self._compute_indicator_state(m)
-
-        self._cached_indicator_state = indicator_state
-        if hasattr(self, "upcoming_indicator"):
-            should_show = indicator_state is not None
-            self.upcoming_indicator.setVisible(should_show)
-            if should_show:
-                self._layout_upcoming_indicator()
-                self.upcoming_indicator.raise_()
-                self.upcoming_indicator.update()
+            p.drawPixmap(rect_x - 1, rect_y - 1, box)
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        for ev in self.event_widgets: ev.update_geometry()
+        self.relayout_blocks()
         self._layout_upcoming_indicator()
-        if hasattr(self, "upcoming_indicator"):
-            self.upcoming_indicator.update()
+        self._schedule_indicator_refresh()
 
     def add_block(self, start_min: int, duration_min: int, title: str = "", color: Optional[QColor] = None,
                   from_rule: bool = False, rule_id: Optional[str]=None, locked: bool=False,
@@ -1182,12 +1778,17 @@ class DayView(QWidget):
         block = EventWidget(self, start_min, end_min, title, color, from_rule=from_rule,
                             rule_id=rule_id, locked=locked, image_rel=image_rel,
                             tag=tag, notify_offset=notify_offset)
+        block.update_geometry()
         block.set_box_selected(False)
-        block.set_mouse_transparent(self.box_select_mode and block not in self._box_selected_widgets)
+        # a new widget starts opaque with no cursor set; the idle cursor is applied on first hover
+        if self.box_select_mode and block not in self._box_selected_widgets:
+            block.set_mouse_transparent(True)
+            self._transparent_widgets.add(block)
         block.show()
         self.event_widgets.append(block)
-        self._refresh_widget_transparency()
+        self._intervals_dirty = True
         self.update()
+        self._schedule_indicator_refresh()
         if record_history:
             self.note_history_action("Add block")
         return block
@@ -1203,16 +1804,23 @@ class DayView(QWidget):
                 new_sel = set(self._box_selected_widgets)
                 new_sel.discard(block)
                 self._update_box_selection(new_sel)
-            self.event_widgets.remove(block); block.deleteLater(); self.on_block_changed(None)
+            self.event_widgets.remove(block); self._intervals_dirty = True
+            block.deleteLater(); self.on_block_changed(None)
             if self.owner and old_img:
                 self.owner.try_delete_image_if_unreferenced(old_img)
             self._refresh_widget_transparency()
 
     def clear_blocks(self):
-        self._update_box_selection(set())
-        for b in self.event_widgets: b.deleteLater()
-        self.event_widgets.clear()
+        self.setUpdatesEnabled(False)
+        try:
+            self._update_box_selection(set())
+            for b in self.event_widgets: b.deleteLater()
+            self.event_widgets.clear()
+            self._intervals_dirty = True
+        finally:
+            self.setUpdatesEnabled(True)
         self.update()
+        self._schedule_indicator_refresh()
 
     def set_box_select_mode(self, enabled: bool):
         enabled = bool(enabled)
@@ -1250,6 +1858,7 @@ class DayView(QWidget):
         for w in add:
             w.set_box_selected(True)
         self._box_selected_widgets = new_selection
+        self._refresh_widget_transparency()
         self._notify_box_selection_changed()
 
     def _notify_box_selection_changed(self):
@@ -1262,7 +1871,6 @@ class DayView(QWidget):
             self.owner.on_box_selection_changed(len(self._box_selected_widgets), total_minutes)
         except Exception:
             pass
-        self._refresh_widget_transparency()
 
     def _apply_box_selection(self, rect: QRect):
         rect = rect.normalized()
@@ -1291,6 +1899,13 @@ class DayView(QWidget):
         self._group_move_last_delta = 0
         self._group_move_refs = [(w, w.start_min, w.end_min) for w in selected]
         self._group_move_selected = selected
+        self._group_move_span = (min(s for _, s, _ in self._group_move_refs),
+                                 max(e for _, _, e in self._group_move_refs))
+        # The interval index is already start-sorted; filtering its parallel lists keeps that order.
+        self._ensure_intervals()
+        keep = [j for j, w in enumerate(self._iv_events) if w not in selected]
+        other_ends = [self._iv_ends[j] for j in keep]
+        self._group_move_others = ([self._iv_starts[j] for j in keep], other_ends, self._prefix_max(other_ends))
         self._box_selecting = False
         if self._box_rubber is not None:
             self._box_rubber.hide()
@@ -1312,21 +1927,16 @@ class DayView(QWidget):
         delta_minutes = self.snap_delta(raw_minutes)
         if delta_minutes == self._group_move_last_delta:
             return
-        new_positions: List[Tuple[EventWidget, int, int]] = []
-        for w, start, end in self._group_move_refs:
-            duration = end - start
-            new_start = start + delta_minutes
-            new_end = end + delta_minutes
-            if new_start < 0 or new_end > 24 * 60:
-                return
-            new_positions.append((w, new_start, new_end))
-        excludes = self._group_move_selected
-        for w, new_start, new_end in new_positions:
-            if self.overlaps_range(new_start, new_end, exclude_set=excludes):
+        span_start, span_end = self._group_move_span
+        if span_start + delta_minutes < 0 or span_end + delta_minutes > 24 * 60:
+            return
+        starts, ends, max_end = self._group_move_others
+        for _, start, end in self._group_move_refs:
+            if self._sorted_hits(starts, ends, max_end, start + delta_minutes, end + delta_minutes):
                 return
-        for w, new_start, new_end in new_positions:
-            w.start_min = new_start
-            w.end_min = new_end
+        for w, start, end in self._group_move_refs:
+            w.start_min = start + delta_minutes
+            w.end_min = end + delta_minutes
             w.update_geometry()
         self._group_move_last_delta = delta_minutes
 
@@ -1335,8 +1945,11 @@ class DayView(QWidget):
             return
         moved = self._group_move_last_delta != 0
         self._group_move_active = False
+        for w, _, _ in self._group_move_refs:
+            w._set_idle_cursor()
         self._group_move_refs = []
         self._group_move_selected = set()
+        self._group_move_others = ([], [], [])
         self._group_move_last_delta = 0
         self._group_move_start_global = 0.0
         if self.box_select_mode:
@@ -1351,8 +1964,11 @@ class DayView(QWidget):
         if not self._group_move_active:
             return
         self._group_move_active = False
+        for w, _, _ in self._group_move_refs:
+            w._set_idle_cursor()
         self._group_move_refs = []
         self._group_move_selected = set()
+        self._group_move_others = ([], [], [])
         self._group_move_last_delta = 0
         self._group_move_start_global = 0.0
         if self.box_select_mode:
@@ -1362,13 +1978,15 @@ class DayView(QWidget):
         self._refresh_widget_transparency()
 
     def _refresh_widget_transparency(self):
-        if not self.box_select_mode:
-            for ev in self.event_widgets:
-                ev.set_mouse_transparent(False)
-            return
-        selected = self._box_selected_widgets
-        for ev in self.event_widgets:
-            ev.set_mouse_transparent(ev not in selected)
+        """Toggle WA_TransparentForMouseEvents only on widgets whose state changes."""
+        live = set(self.event_widgets)
+        target = live - self._box_selected_widgets if self.box_select_mode else set()
+        current = self._transparent_widgets & live  # drop widgets deleted since the last refresh
+        for ev in target - current:
+            ev.set_mouse_transparent(True)
+        for ev in current - target:
+            ev.set_mouse_transparent(False)
+        self._transparent_widgets = target
 
     def delete_selected_blocks(self):
         selected = set(self._box_selected_widgets)
@@ -1382,20 +2000,39 @@ class DayView(QWidget):
         self._cancel_group_move()
         from_rules = [w for w in selected if w.from_rule]
         regulars = [w for w in selected if not w.from_rule]
-        for w in list(regulars):
-            self.delete_block(w)
-        if from_rules and self.owner:
-            for w in from_rules:
-                self.owner.delete_daily_rule_with_cleanup(w.rule_id)
-            self.owner.load_day(self.owner.current_date)
+        # One removal pass, one change notification (and history snapshot) and one repaint for the
+        # whole selection, rather than going through delete_block per widget.
+        self.setUpdatesEnabled(False)
+        try:
+            if regulars:
+                doomed = set(regulars)
+                self._update_box_selection(self._box_selected_widgets - doomed)
+                self.event_widgets[:] = [w for w in self.event_widgets if w not in doomed]
+                self._intervals_dirty = True
+                for w in regulars:
+                    w.deleteLater()
+                self.on_block_changed(None)
+                if self.owner:
+                    for rel in {w.image_rel for w in regulars if w.image_rel}:
+                        self.owner.try_delete_image_if_unreferenced(rel)
+            if from_rules and self.owner:
+                for w in from_rules:
+                    self.owner.delete_daily_rule_with_cleanup(w.rule_id)
+                self.owner.load_day(self.owner.current_date)
+            self._update_box_selection(set())
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
         total_deleted = len(regulars) + len(from_rules)
-        self._update_box_selection(set())
         if self.owner and total_deleted:
             self.owner.flash_status(f"Deleted {total_deleted} event{'s' if total_deleted != 1 else ''}")
 
     def get_selected_widgets(self) -> Set['EventWidget']:
         return set(self._box_selected_widgets)
 
+    def is_box_selected(self, widget: 'EventWidget') -> bool:
+        return widget in self._box_selected_widgets
+
     def finalize_single_move(self, widget: 'EventWidget', orig_start: int, orig_end: int):
         duration = max(1, widget.end_min - widget.start_min)
         if widget.start_min == orig_start and widget.end_min == orig_end:
@@ -1416,8 +2053,38 @@ class DayView(QWidget):
         widget.update_geometry()
         self.on_block_changed(widget)
 
-    def on_block_changed(self, _block: Optional['EventWidget']):
-        self.update()
+    def _schedule_update(self, rect: Optional[QRect] = None):
+        """Queue a repaint of `rect` (or the whole view) for the next coalesced flush."""
+        if rect is None:
+            self._dirty_full = True
+        elif not self._dirty_full:
+            self._dirty_region = self._dirty_region.united(rect)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_scheduled_update(self):
+        if self._dirty_full:
+            self.update()
+        elif not self._dirty_region.isEmpty():
+            self.update(self._dirty_region)
+        self._dirty_region = QRegion()
+        self._dirty_full = False
+
+    def _queue_drag_move(self, widget: 'EventWidget', global_pos: QPointF):
+        self._pending_drag = (widget, QPointF(global_pos))
+        if not self._drag_timer.isActive():
+            self._drag_timer.start()
+
+    def _flush_pending_drag(self):
+        pending, self._pending_drag = self._pending_drag, None
+        self._drag_timer.stop()
+        if pending is not None and pending[0] in self.event_widgets:
+            pending[0]._apply_drag(pending[1])
+
+    def on_block_changed(self, block: Optional['EventWidget']):
+        # Vacated areas of moved children are exposed by Qt itself; only the block's own band needs us.
+        self._schedule_update(block.geometry().adjusted(-2, -2, 2, 2) if block is not None else None)
+        self._schedule_indicator_refresh()
         if self.owner is not None: self.owner.on_day_changed()
 
     def set_time_size(self, minutes: int):
@@ -1431,10 +2098,7 @@ class DayView(QWidget):
         self.time_size_minutes = minutes
         if hasattr(self.prefs, "time_size_minutes"):
             self.prefs.time_size_minutes = int(self.time_size_minutes)
-            try:
-                self.prefs.save(PREF_PATH)
-            except Exception:
-                pass
+            self.schedule_prefs_save()
         self.update()
 
     def set_snap_enabled(self, enabled: bool):
@@ -1444,10 +2108,7 @@ class DayView(QWidget):
         self.snap_enabled = enabled
         if hasattr(self.prefs, "time_snap_enabled"):
             self.prefs.time_snap_enabled = bool(enabled)
-            try:
-                self.prefs.save(PREF_PATH)
-            except Exception:
-                pass
+            self.schedule_prefs_save()
         self.update()
         self._refresh_widget_transparency()
 
@@ -1458,10 +2119,7 @@ class DayView(QWidget):
         self.magnetic_mode = enabled
         if hasattr(self.prefs, "magnetic_mode"):
             self.prefs.magnetic_mode = bool(enabled)
-            try:
-                self.prefs.save(PREF_PATH)
-            except Exception:
-                pass
+            self.schedule_prefs_save()
         self.update()
 
     def set_smart_scale_enabled(self, enabled: bool):
@@ -1471,39 +2129,71 @@ class DayView(QWidget):
         self.smart_scale_enabled = enabled
         if hasattr(self.prefs, "smart_scale_enabled"):
             self.prefs.smart_scale_enabled = bool(enabled)
-            try:
-                self.prefs.save(PREF_PATH)
-            except Exception:
-                pass
+            self.schedule_prefs_save()
         self.update()
 
+    def schedule_prefs_save(self):
+        self._prefs_save_timer.start()
+
+    def flush_prefs_save(self):
+        """Write pref.ini now if a save is pending; otherwise leave the file alone."""
+        if self._prefs_save_timer.isActive():
+            self._prefs_save_timer.stop()
+            self._write_prefs()
+
+    def _write_prefs(self):
+        try:
+            self.prefs.save(PREF_PATH)
+        except Exception:
+            pass
+
     def set_prefs(self, prefs: Prefs):
         self.prefs = prefs
+        self._rebuild_paint_cache()
         self.time_size_minutes = max(1, int(getattr(prefs, "time_size_minutes", getattr(prefs, "time_snap_minutes", self.time_size_minutes))))
         self.snap_enabled = bool(getattr(prefs, "time_snap_enabled", True))
         self.smart_scale_enabled = bool(getattr(prefs, "smart_scale_enabled", False))
         self.magnetic_mode = bool(getattr(prefs, "magnetic_mode", False))
-        self.set_zoom_from_percent(prefs.zoom_percent)
-        for ev in self.event_widgets: ev.update_geometry()
-        self.update()
+        self._time_24h = bool(prefs.time_24h)
+        self.set_zoom_from_percent(prefs.zoom_percent)  # re-lays out every block
         self._refresh_widget_transparency()
     def set_zoom_from_percent(self, display_percent: int):
         display_percent = max(50, min(500, int(display_percent)))
         self.prefs.zoom_percent = display_percent
-        self.px_per_min = BASE_PX_PER_MIN * (display_percent / 100.0)
+        self._set_px_per_min(BASE_PX_PER_MIN * (display_percent / 100.0))
         self._update_height()
-        for ev in self.event_widgets: ev.update_geometry()
-        self.update()
+        self.relayout_blocks()
+
+    def relayout_blocks(self):
+        """update_geometry for every block in one pass, sharing x/width and the scale lookups."""
+        with self.bulk_geometry_update():
+            x = self.gutter + 10
+            w = max(120, self.width() - x - 10)
+            ppm = self.px_per_min; pad = self.top_pad
+            for ev in self.event_widgets:
+                y = int(ev.start_min * ppm) + pad
+                ev._apply_geometry(x, y, w, max(10, int(ev.end_min * ppm) + pad - y))
+
+    @contextmanager
+    def bulk_geometry_update(self):
+        """Re-lay out many blocks with painting suspended, then repaint once."""
+        was_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(was_enabled)
+            self.update()
 
     def mousePressEvent(self, e):
         if self.box_select_mode:
             if e.button() == Qt.MouseButton.LeftButton:
                 pos = e.position().toPoint()
-                hit = None
-                for w in self._box_selected_widgets:
-                    if w.geometry().contains(pos):
-                        hit = w
-                        break
+                # Unselected blocks are transparent for mouse events in box mode, so Qt's own
+                # child lookup lands on a selected block or on nothing we care about.
+                hit = self.childAt(pos)
+                if hit not in self._box_selected_widgets:
+                    hit = None
                 if hit and self._start_group_move(e.globalPosition().y()):
                     e.accept()
                 else:
@@ -1580,18 +2270,43 @@ class DayView(QWidget):
 
 
 class UpcomingIndicator(QWidget):
+    _bubble_font: Optional[QFont] = None
+    _bubble_metrics: Optional[QFontMetrics] = None
+
     def __init__(self, day_view: 'DayView'):
         super().__init__(day_view)
         self.day_view = day_view
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        self._state: Optional[dict] = None
+        # Bar + bubble only change at minute resolution; paints blit this band instead of redrawing.
+        self._cached_pixmap: Optional[QPixmap] = None
+        self._cached_top = 0
+        self._cached_key: Optional[tuple] = None
+        # Rotated bubbles keyed on text/colors/dpr/sub-pixel offset; the text changes once a minute.
+        self._bubble_cache: Dict[tuple, QPixmap] = {}
+
+    def set_state(self, state: Optional[dict]):
+        self._state = state
+        self.update()
 
     def paintEvent(self, event):
-        state = getattr(self.day_view, "_cached_indicator_state", None)
+        state = self._state
         if not state:
             return
-        p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        prefs = self.day_view.prefs
+        key = (state["y_now"], state["y_event"], state["text"], self.width(), self.height(),
+               self.devicePixelRatioF(), prefs.upcoming_bar.rgba(), prefs.upcoming_bar_bg.rgba(),
+               prefs.upcoming_bar_bg_opacity)
+        if key != self._cached_key:
+            self._cached_pixmap, self._cached_top = self._render_band(state)
+            self._cached_key = key
+        if self._cached_pixmap is not None:
+            QPainter(self).drawPixmap(0, self._cached_top, self._cached_pixmap)
+
+    def _render_band(self, state: dict) -> Tuple[Optional[QPixmap], int]:
+        """Rasterize the bar + bubble into a pixmap covering only the rows they touch."""
         line_color = QColor(self.day_view.prefs.upcoming_bar)
         bubble_bg = QColor(self.day_view.prefs.upcoming_bar_bg)
         opacity_pct = int(getattr(self.day_view.prefs, "upcoming_bar_bg_opacity", 40))
@@ -1601,18 +2316,15 @@ class UpcomingIndicator(QWidget):
         y_now = max(0, min(self.height(), state["y_now"]))
         y_event = max(0, min(self.height(), state["y_event"]))
         if y_event <= y_now:
-            return
+            return None, 0
 
-        line_pen = QPen(line_color, 4); line_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        p.setPen(line_pen)
         line_x = self.width() - 20
-        p.drawLine(int(line_x), int(y_now), int(line_x), int(y_event))
-
         center_y = (y_now + y_event) / 2.0
         bubble_text = state["text"]
-        bubble_font = make_ui_font(9, QFont.Weight.DemiBold)
-        p.setFont(bubble_font)
-        metrics = QFontMetrics(bubble_font)
+        if UpcomingIndicator._bubble_font is None:
+            UpcomingIndicator._bubble_font = make_ui_font(9, QFont.Weight.DemiBold)
+            UpcomingIndicator._bubble_metrics = QFontMetrics(UpcomingIndicator._bubble_font)
+        metrics = self._bubble_metrics
         text_w = metrics.horizontalAdvance(bubble_text)
         text_h = metrics.height()
         pad_w, pad_h = 10, 6
@@ -1621,20 +2333,64 @@ class UpcomingIndicator(QWidget):
         half_len = bubble_w / 2.0
         center_y = max(half_len, min(self.height() - half_len, center_y))
 
-        p.save()
-        p.translate(line_x - (bubble_h / 2.0) - 16, center_y)
+        # 4px round-capped line and the rotated bubble (its length runs vertically), plus AA slack
+        top = max(0, int(min(y_now, center_y - half_len)) - 4)
+        bottom = min(self.height(), int(max(y_event, center_y + half_len)) + 5)
+        dpr = self.devicePixelRatioF()
+        pm = QPixmap(max(1, int(self.width() * dpr)), max(1, int((bottom - top) * dpr)))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm); p.setRenderHint(_ANTIALIAS)
+        p.translate(0, -top)
+
+        line_pen = QPen(line_color, 4); line_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        p.setPen(line_pen)
+        p.drawLine(int(line_x), int(y_now), int(line_x), int(y_event))
+
+        bubble_x = line_x - (bubble_h / 2.0) - 16
+        left = int(bubble_x - bubble_h / 2.0) - 1  # 1px slack for the AA outline
+        upper = int(center_y - half_len) - 1
+        frac = (bubble_x - left, center_y - upper)
+        key = (bubble_text, line_color.rgba(), bubble_bg.rgba(), dpr, frac)
+        bubble = self._bubble_cache.get(key)
+        if bubble is None:
+            if len(self._bubble_cache) >= 8:
+                self._bubble_cache.clear()
+            bubble = self._bubble_pixmap(bubble_text, line_color, bubble_bg, bubble_w, bubble_h, frac, dpr)
+            self._bubble_cache[key] = bubble
+        p.drawPixmap(left, upper, bubble)
+        p.end()
+        return pm, top
+
+    def _bubble_pixmap(self, text: str, line_color: QColor, bubble_bg: QColor,
+                       bubble_w: int, bubble_h: int, center: Tuple[float, float], dpr: float) -> QPixmap:
+        """The "in N min" bubble rotated -90°, centered at `center` inside its own pixmap."""
+        pm = QPixmap(max(1, int((bubble_h + 3) * dpr)), max(1, int((bubble_w + 3) * dpr)))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm); p.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        p.setFont(self._bubble_font)
+        p.translate(center[0], center[1])
         p.rotate(-90)
         rect = QRectF(-bubble_w / 2.0, -bubble_h / 2.0, bubble_w, bubble_h)
         p.setPen(QPen(line_color, 1))
         p.setBrush(QBrush(bubble_bg))
         p.drawRoundedRect(rect, 10, 10)
         p.setPen(QPen(line_color))
-        p.drawText(rect, Qt.AlignmentFlag.AlignCenter, bubble_text)
-        p.restore()
+        p.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        p.end()
+        return pm
 
 
 class EventWidget(QWidget):
     HANDLE = 6
+    _start_min = -1  # class defaults so the first assignment in __init__ registers as a change
+    _end_min = -1
+    # Shared by every block; QFont needs a QApplication, so these are built on first paint.
+    _title_font: Optional[QFont] = None
+    _center_font: Optional[QFont] = None
+    _handle_pen: Optional[QPen] = None
+    _highlight_pen: Optional[QPen] = None
     def __init__(self, day_view: DayView, start_min: int, end_min: int, title: str = "",
                  color: Optional[QColor] = None, from_rule: bool = False, rule_id: Optional[str]=None,
                  locked: bool=False, image_rel: Optional[str]=None, tag: Optional[str]=None,
@@ -1651,27 +2407,77 @@ class EventWidget(QWidget):
         self.locked = locked
         self.image_rel = image_rel
         self.pixmap: Optional[QPixmap] = None
+        self._pixmap_loaded = False  # decoded on the first paint that has room to show it
+        self._scaled_pixmaps: Dict[Tuple[int, float], QPixmap] = {}
         self.notify_offset = max(0, int(notify_offset or 0))
-        self._load_pixmap()
         self._box_selected = False
         self._group_dragging = False
+        self._paint_key: Optional[tuple] = None
+        self._text_key: Optional[tuple] = None
+        self._header_rect = QRect(); self._header_text_rect = QRect()  # set in resizeEvent
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.DefaultContextMenu)
         self._drag_mode: Optional[str] = None
         self._press_global_y: float = 0.0
         self._orig_start = self.start_min; self._orig_end = self.end_min
         self._orig_duration = max(1, self._orig_end - self._orig_start)
-        self.setMouseTracking(True); self.update_geometry()
+        # Mouse tracking and the hover cursor are set up in enterEvent; DayView.add_block lays the block out.
+
+    # start/end go through properties so DayView's interval index knows when to rebuild
+    @property
+    def start_min(self) -> int:
+        return self._start_min
+
+    @start_min.setter
+    def start_min(self, value: int):
+        if value != self._start_min:
+            self._start_min = value
+            self.day_view._intervals_dirty = True
+
+    @property
+    def end_min(self) -> int:
+        return self._end_min
+
+    @end_min.setter
+    def end_min(self, value: int):
+        if value != self._end_min:
+            self._end_min = value
+            self.day_view._intervals_dirty = True
 
     def _load_pixmap(self):
+        self._scaled_pixmaps = {}  # (side, dpr) -> pre-scaled image
+        self._pixmap_loaded = True
         if self.image_rel:
             p = QPixmap(str(APP_DIR / self.image_rel))
             self.pixmap = p if not p.isNull() else None
         else:
             self.pixmap = None
 
+    def _scaled_pixmap(self, side: int) -> QPixmap:
+        """The attached image scaled to side x side once, instead of on every paint of a drag."""
+        dpr = self.devicePixelRatioF()
+        key = (side, dpr)
+        cache = self._scaled_pixmaps
+        pm = cache.pop(key, None)
+        if pm is None:
+            px = max(1, int(round(side * dpr)))
+            pm = self.pixmap.scaled(px, px, Qt.AspectRatioMode.IgnoreAspectRatio,
+                                    Qt.TransformationMode.SmoothTransformation)
+            pm.setDevicePixelRatio(dpr)
+            if len(cache) >= 8:
+                del cache[next(iter(cache))]  # least recently used
+        cache[key] = pm
+        return pm
+
     def _base_chunk(self) -> int:
         return max(1, self.day_view.time_size_minutes)
 
+    @staticmethod
+    def _fit_duration(target: int, free: int, chunk: int) -> int:
+        """Largest `target - k*chunk` that fits in `free` minutes, never below one chunk."""
+        if target <= free:
+            return target
+        return max(chunk, target - -(-(target - free) // chunk) * chunk)
+
     def _smart_scale_resize_bottom(self, minute_at_cursor: int):
         chunk = self._base_chunk()
         minute_at_cursor = max(self._orig_start + chunk, min(minute_at_cursor, 24 * 60))
@@ -1680,23 +2486,8 @@ class EventWidget(QWidget):
         target_duration = max(chunk, self._orig_duration + steps * chunk)
         max_duration = max(chunk, ((24 * 60 - self._orig_start) // chunk) * chunk or chunk)
         target_duration = max(chunk, min(target_duration, max_duration))
-        duration = target_duration
-        direction = 1 if duration >= self._orig_duration else -1
-        attempts = 0
-        while attempts < 1000:
-            duration = max(chunk, min(duration, max_duration))
-            new_end = self._orig_start + duration
-            if new_end > 24 * 60:
-                duration -= chunk
-                attempts += 1
-                continue
-            if not self.day_view.overlaps_range(self._orig_start, new_end, exclude=self):
-                break
-            duration -= chunk if direction >= 0 else -chunk
-            if duration < chunk:
-                duration = chunk
-                break
-            attempts += 1
+        free = self.day_view.next_block_start_after(self._orig_start, exclude=self) - self._orig_start
+        duration = self._fit_duration(target_duration, free, chunk)
         self.start_min = self._orig_start
         self.end_min = min(24 * 60, self._orig_start + duration)
         self.update_geometry()
@@ -1709,23 +2500,8 @@ class EventWidget(QWidget):
         target_duration = max(chunk, self._orig_duration + steps * chunk)
         max_duration = max(chunk, ((self._orig_end) // chunk) * chunk or chunk)
         target_duration = max(chunk, min(target_duration, max_duration))
-        duration = target_duration
-        direction = 1 if duration >= self._orig_duration else -1
-        attempts = 0
-        while attempts < 1000:
-            duration = max(chunk, min(duration, max_duration))
-            new_start = self._orig_end - duration
-            if new_start < 0:
-                duration -= chunk
-                attempts += 1
-                continue
-            if not self.day_view.overlaps_range(new_start, self._orig_end, exclude=self):
-                break
-            duration -= chunk if direction >= 0 else -chunk
-            if duration < chunk:
-                duration = chunk
-                break
-            attempts += 1
+        free = self._orig_end - self.day_view.prev_block_end_before(self._orig_end, exclude=self)
+        duration = self._fit_duration(target_duration, free, chunk)
         self.start_min = max(0, self._orig_end - duration)
         self.end_min = self._orig_end
         self.update_geometry()
@@ -1743,37 +2519,68 @@ class EventWidget(QWidget):
         else:
             self._set_idle_cursor()
 
+    def enterEvent(self, e):
+        if not self.hasMouseTracking():
+            self.setMouseTracking(True)
+            self._set_idle_cursor()
+        super().enterEvent(e)
+
     def _set_idle_cursor(self):
         if self.locked:
-            self.setCursor(Qt.CursorShape.ForbiddenCursor)
+            self.setCursor(_FORBIDDEN)
         else:
-            self.setCursor(Qt.CursorShape.OpenHandCursor)
+            self.setCursor(_OPEN_HAND)
 
     def update_geometry(self):
         x = self.day_view.gutter + 10
         w = max(120, self.day_view.width() - x - 10)
         y = self.day_view.minute_to_y(self.start_min)
         h = max(10, self.day_view.minute_to_y(self.end_min) - y)
-        self.setGeometry(QRect(x, y, w, h))
+        self._apply_geometry(x, y, w, h)
+
+    def _apply_geometry(self, x: int, y: int, w: int, h: int):
+        rect = QRect(x, y, w, h)
+        if rect == self.geometry():
+            return  # drag samples that clamp/snap to the same minute
+        self.setGeometry(rect)
         self.update()
-        self.day_view.update()
 
-    def paintEvent(self, event):
-        p = QPainter(self); p.setRenderHint(QPainter.RenderHint.Antialiasing)
-        rect = self.rect().adjusted(0, 0, -1, -1)
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        # Header band and its padded text area depend only on the width; paintEvent reuses them.
+        self._header_rect = QRect(1, 1, self.width() - 3, 22)
+        self._header_text_rect = self._header_rect.adjusted(8, 0, -8, 0)
+
+    @classmethod
+    def _init_shared_paint(cls):
+        cls._title_font = make_ui_font(9, QFont.Weight.Medium, emoji=True)
+        cls._center_font = make_ui_font(9, QFont.Weight.Medium)
+        cls._handle_pen = QPen(QColor(255, 255, 255, 200), 2)
+        highlight_pen = QPen(QColor("#007AFF"), 2, Qt.PenStyle.DashLine)
+        highlight_pen.setCosmetic(True)
+        cls._highlight_pen = highlight_pen
+
+    def _ensure_paint_cache(self):
+        """Fill brush, border pen and header color; rebuilt only when color/lock/border pref change."""
+        border_pref = self.day_view.prefs.event_border
+        key = (self.color.rgba(), self.locked, border_pref.rgba())
+        if key == self._paint_key:
+            return
         fill = QColor(self.color); fill.setAlpha(180)
-        border = QColor(self.day_view.prefs.event_border)
+        border = QColor(border_pref)
         if self.locked: border.setAlpha(180)
-        p.setBrush(QBrush(fill)); p.setPen(QPen(border, 1))
-        p.drawRoundedRect(rect, 6, 6)
-
-        header_rect = QRect(rect.x() + 1, rect.y() + 1, rect.width() - 2, 22)
         header_color = QColor(self.color); header_color.setAlpha(220)
-        p.fillRect(header_rect, header_color)
-
-        # Title (emoji ok)
-        p.setPen(self.day_view.prefs.header_text)
-        p.setFont(make_ui_font(9, QFont.Weight.Medium, emoji=True))
+        self._fill_brush = QBrush(fill)
+        self._border_pen = QPen(border, 1)
+        self._header_color = header_color
+        self._paint_key = key
+
+    def _ensure_static_texts(self):
+        """Header strings as pre-laid-out QStaticText; rebuilt only when their inputs change."""
+        key = (self.title, self.tag, self.locked, self.from_rule,
+               self.start_min, self.end_min, self.day_view._time_24h)
+        if key == self._text_key:
+            return
         base_title = (self.title or "(untitled)").strip()
         parts: List[str] = []
         if self.locked:
@@ -1783,62 +2590,91 @@ class EventWidget(QWidget):
         parts.append(base_title)
         left_text = " ".join(parts)
         if self.from_rule: left_text += "  ⟳"
-        p.drawText(header_rect.adjusted(8, 0, -8, 0),
-                   Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
-                   left_text)
+        duration_min = max(1, self.end_min - self.start_min)
+        self._dur_text = _fmt_duration(duration_min)
+        is_24h = self.day_view._time_24h
+        time_text = f"{_fmt_hhmm(self.start_min, is_24h)} – {_fmt_hhmm(self.end_min, is_24h)}"
+        self._st_title = self._static_text(left_text, self._title_font)
+        self._st_duration = self._static_text(self._dur_text, self._center_font)
+        self._st_time = self._static_text(time_text, self._center_font)
+        self._text_key = key
+
+    @staticmethod
+    def _static_text(text: str, font: QFont) -> QStaticText:
+        st = QStaticText(text)
+        st.setTextFormat(Qt.TextFormat.PlainText)
+        st.prepare(font=font)
+        return st
+
+    @staticmethod
+    def _vcenter(rect: QRect, st: QStaticText) -> float:
+        return rect.y() + (rect.height() - st.size().height()) / 2.0
+
+    def paintEvent(self, event):
+        if EventWidget._title_font is None:
+            EventWidget._init_shared_paint()
+        self._ensure_paint_cache()
+        p = QPainter(self); p.setRenderHint(_ANTIALIAS)
+        rect = self.rect().adjusted(0, 0, -1, -1)
+        p.setBrush(self._fill_brush); p.setPen(self._border_pen)
+        p.drawRoundedRect(rect, 6, 6)
+
+        header_rect = self._header_rect
+        p.fillRect(header_rect, self._header_color)
+
+        # Title (emoji ok)
+        self._ensure_static_texts()
+        p.setPen(self.day_view.prefs.header_text)
+        p.setFont(self._title_font)
+        text_rect = self._header_text_rect
+        st = self._st_title
+        # drawStaticText does not clip like drawText(rect, ...) did, so clip each string to its rect
+        p.setClipRect(text_rect)
+        p.drawStaticText(QPointF(text_rect.x(), self._vcenter(header_rect, st)), st)
 
         # Duration centered (and show remaining time when in-progress on current day)
-        duration_min = max(1, self.end_min - self.start_min)
-        dh, dm = divmod(duration_min, 60)
-        dur_text = f"{dh}h {dm}m" if dh and dm else (f"{dh}h" if dh else f"{dm}m")
+        dur_text = self._dur_text
 
-        remaining_text = ""
-        if self.day_view.show_now_line:
-            now = QTime.currentTime()
-            current_min = now.hour() * 60 + now.minute()
-            if self.start_min <= current_min < self.end_min:
-                rem_min = self.end_min - current_min
-                rh, rm = divmod(rem_min, 60)
-                parts: List[str] = []
-                if rh:
-                    parts.append(f"{rh}h")
-                if rm:
-                    parts.append(f"{rm}m")
-                if not parts:
-                    parts.append("0m")
-                remaining_text = f"REM {' '.join(parts)}"
-
-        center_text = dur_text if not remaining_text else f"{dur_text}   {remaining_text}"
-        p.setFont(make_ui_font(9, QFont.Weight.Medium))
-        p.drawText(header_rect, Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignHCenter, center_text)
+        remaining_text = self.day_view._remaining_text(self.start_min, self.end_min) if self.day_view.show_now_line else ""
 
-        # Time range right
-        time_text = f"{self.day_view.min_to_hhmm(self.start_min)} – {self.day_view.min_to_hhmm(self.end_min)}"
-        p.drawText(header_rect.adjusted(8, 0, -8, 0),
-                   Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignRight,
-                   time_text)
+        p.setFont(self._center_font)
+        p.setClipRect(header_rect)
+        if remaining_text:
+            p.drawText(header_rect, _ALIGN_VCENTER_CENTER,
+                       f"{dur_text}   {remaining_text}")
+        else:
+            st = self._st_duration
+            p.drawStaticText(QPointF(header_rect.x() + (header_rect.width() - st.size().width()) / 2.0,
+                                     self._vcenter(header_rect, st)), st)
 
-        # Handles
-        p.setPen(QPen(QColor(255, 255, 255, 200), 2))
+        # Time range right
+        st = self._st_time
+        p.setClipRect(text_rect)
+        p.drawStaticText(QPointF(text_rect.x() + text_rect.width() - st.size().width(), self._vcenter(header_rect, st)), st)
+        p.setClipping(False)
+
+        # Handles (axis-aligned on whole pixels, so AA only costs rasterizer time)
+        p.setRenderHint(_ANTIALIAS, False)
+        p.setPen(self._handle_pen)
         p.drawLine(10, self.HANDLE, self.width() - 10, self.HANDLE)
         p.drawLine(10, self.height() - self.HANDLE, self.width() - 10, self.height() - self.HANDLE)
+        p.setRenderHint(_ANTIALIAS, True)
 
         # Attached image (top-right inside block, 16px padding). Fit if height is small.
-        if self.pixmap:
+        if self.image_rel:
             padding = 16
             available_h = max(0, self.height() - header_rect.height() - padding - 4)
-            if available_h > 0:
+            if available_h > 0 and not self._pixmap_loaded:
+                self._load_pixmap()
+            if available_h > 0 and self.pixmap:
                 side = min(256, available_h)  # scale down to fit short blocks
                 side = max(1, side)
                 x = self.width() - padding - side
                 y = header_rect.bottom() + 4
-                p.drawPixmap(QRect(int(x), int(y), int(side), int(side)),
-                             self.pixmap, self.pixmap.rect())
+                p.drawPixmap(int(x), int(y), self._scaled_pixmap(int(side)))
 
         if self._box_selected:
-            highlight_pen = QPen(QColor("#007AFF"), 2, Qt.PenStyle.DashLine)
-            highlight_pen.setCosmetic(True)
-            p.setPen(highlight_pen)
+            p.setPen(self._highlight_pen)
             p.setBrush(Qt.BrushStyle.NoBrush)
             p.drawRoundedRect(rect.adjusted(1, 1, -1, -1), 6, 6)
 
@@ -1846,39 +2682,41 @@ class EventWidget(QWidget):
         magnetic = bool(getattr(self.day_view, "magnetic_mode", False))
         smart_scale = bool(getattr(self.day_view, "smart_scale_enabled", False))
         if self.locked:
-            self.setCursor(Qt.CursorShape.ForbiddenCursor)
+            self.setCursor(_FORBIDDEN)
             return
         if smart_scale:
-            self.setCursor(Qt.CursorShape.SizeVerCursor)
+            self.setCursor(_SIZE_VER)
             return
         if magnetic:
-            self.setCursor(Qt.CursorShape.OpenHandCursor)
+            self.setCursor(_OPEN_HAND)
             return
         if y <= self.HANDLE or y >= self.height() - self.HANDLE:
-            self.setCursor(Qt.CursorShape.SizeVerCursor)
+            self.setCursor(_SIZE_VER)
         else:
-            self.setCursor(Qt.CursorShape.OpenHandCursor)
+            self.setCursor(_OPEN_HAND)
 
     def mousePressEvent(self, e):
-        magnetic = bool(getattr(self.day_view, "magnetic_mode", False))
-        smart_scale = bool(getattr(self.day_view, "smart_scale_enabled", False))
-        if self.day_view.box_select_mode:
-            if e.button() == Qt.MouseButton.LeftButton:
-                if self in self.day_view.get_selected_widgets():
-                    if self.day_view.start_group_move_by_widget(self, e.globalPosition().y()):
+        dv = self.day_view
+        magnetic = dv.magnetic_mode
+        smart_scale = dv.smart_scale_enabled
+        button = e.button()
+        if dv.box_select_mode:
+            if button == _LEFT:
+                if dv.is_box_selected(self):
+                    if dv.start_group_move_by_widget(self, e.globalPosition().y()):
                         self._group_dragging = True
                         e.accept()
                     else:
                         e.ignore()
                 else:
                     e.ignore()
-            elif e.button() == Qt.MouseButton.RightButton:
+            elif button == Qt.MouseButton.RightButton:
                 super().mousePressEvent(e)
             else:
                 e.ignore()
             return
-        if self.locked and e.button() == Qt.MouseButton.LeftButton:
-            owner = getattr(self.day_view, "owner", None)
+        if self.locked and button == _LEFT:
+            owner = dv.owner
             if owner:
                 owner.flash_status("Event is locked", warn=True)
             self._drag_mode = None
@@ -1886,27 +2724,27 @@ class EventWidget(QWidget):
             self._set_idle_cursor()
             e.accept()
             return
-        if e.button() == Qt.MouseButton.LeftButton:
+        if button == _LEFT:
             self.raise_()
             y = e.position().y()
             if smart_scale:
                 if y <= self.HANDLE:
-                    self._drag_mode = "resize_top"; self.setCursor(Qt.CursorShape.SizeVerCursor)
+                    self._drag_mode = "resize_top"; self.setCursor(_SIZE_VER)
                 elif y >= self.height() - self.HANDLE:
-                    self._drag_mode = "resize_bottom"; self.setCursor(Qt.CursorShape.SizeVerCursor)
+                    self._drag_mode = "resize_bottom"; self.setCursor(_SIZE_VER)
                 else:
                     self._drag_mode = None
                     self._set_idle_cursor()
-                    if self.day_view.owner:
-                        self.day_view.owner.statusBar().showMessage("Smart scale: use handles to resize", 1500)
+                    if dv.owner:
+                        dv.owner.statusBar().showMessage("Smart scale: use handles to resize", 1500)
                     e.accept()
                     return
             else:
-                if y <= self.HANDLE: self._drag_mode = "resize_top"; self.setCursor(Qt.CursorShape.SizeVerCursor)
-                elif y >= self.height() - self.HANDLE: self._drag_mode = "resize_bottom"; self.setCursor(Qt.CursorShape.SizeVerCursor)
-                else: self._drag_mode = "move"; self.setCursor(Qt.CursorShape.ClosedHandCursor)
+                if y <= self.HANDLE: self._drag_mode = "resize_top"; self.setCursor(_SIZE_VER)
+                elif y >= self.height() - self.HANDLE: self._drag_mode = "resize_bottom"; self.setCursor(_SIZE_VER)
+                else: self._drag_mode = "move"; self.setCursor(_CLOSED_HAND)
                 if magnetic:
-                    self._drag_mode = "move"; self.setCursor(Qt.CursorShape.ClosedHandCursor)
+                    self._drag_mode = "move"; self.setCursor(_CLOSED_HAND)
             self._press_global_y = e.globalPosition().y()
             self._orig_start = self.start_min; self._orig_end = self.end_min
             self._orig_duration = max(1, self._orig_end - self._orig_start)
@@ -1915,17 +2753,14 @@ class EventWidget(QWidget):
             super().mousePressEvent(e)
 
     def mouseMoveEvent(self, e):
-        magnetic = bool(getattr(self.day_view, "magnetic_mode", False))
-        smart_scale = bool(getattr(self.day_view, "smart_scale_enabled", False))
-        if self.day_view.box_select_mode:
+        dv = self.day_view
+        if dv.box_select_mode:
             if self._group_dragging:
-                self.day_view._update_group_move(e.globalPosition().y())
+                dv._update_group_move(e.globalPosition().y())
                 e.accept()
             else:
                 e.ignore()
             return
-        block_size = self._base_chunk()
-        snap_active = magnetic
         if self._drag_mode is None:
             self._hover_update_cursor(e.position().y()); return
         if self.locked:
@@ -1933,93 +2768,104 @@ class EventWidget(QWidget):
             self._hover_update_cursor(e.position().y())
             e.accept()
             return
+        dv._queue_drag_move(self, e.globalPosition())
+        e.accept()
+
+    def _apply_drag(self, global_pos: QPointF):
+        """Move/resize step for the latest mouse sample; DayView runs at most one per event-loop pass."""
+        if self._drag_mode is None or self.locked:
+            return
+        dv = self.day_view
+        magnetic = dv.magnetic_mode
+        smart_scale = dv.smart_scale_enabled
+        block_size = max(1, dv.time_size_minutes)
+        snap_active = magnetic
 
         if self._drag_mode == "move":
             if smart_scale:
-                e.accept()
                 return
-            delta_px = e.globalPosition().y() - self._press_global_y
-            raw_minutes = delta_px / self.day_view.px_per_min
-            delta_min = self.day_view.snap_delta(raw_minutes)
+            delta_px = global_pos.y() - self._press_global_y
+            raw_minutes = delta_px / dv.px_per_min
+            delta_min = dv.snap_delta(raw_minutes)
             duration = block_size
             if snap_active:
                 duration = max(1, self._orig_duration)
             new_start = self._orig_start + delta_min
             direction = 1 if delta_min >= 0 else -1
-            clamped = self.day_view.clamp_start_to_available(new_start, duration, exclude=self, direction=direction)
+            clamped = dv.clamp_start_to_available(new_start, duration, exclude=self, direction=direction)
             if clamped is not None:
                 self.start_min = clamped
                 self.end_min = self.start_min + duration
                 if snap_active:
                     snapped = False
                     if direction >= 0:
-                        snapped = self.day_view.snap_block_to_neighbors(self, allow_start=True, allow_end=False)
+                        snapped = dv.snap_block_to_neighbors(self, allow_start=True, allow_end=False)
                     else:
-                        snapped = self.day_view.snap_block_to_neighbors(self, allow_start=False, allow_end=True)
+                        snapped = dv.snap_block_to_neighbors(self, allow_start=False, allow_end=True)
                     if not snapped:
-                        self.day_view.snap_block_to_neighbors(self, allow_start=True, allow_end=True)
+                        dv.snap_block_to_neighbors(self, allow_start=True, allow_end=True)
                 self.update_geometry()
-            e.accept()
         else:
-            day_y = self.day_view.mapFromGlobal(e.globalPosition().toPoint()).y()
-            minute_at_cursor = self.day_view.y_to_minute(day_y)
+            day_y = dv.mapFromGlobal(global_pos.toPoint()).y()
+            minute_at_cursor = dv.y_to_minute(day_y)
             if self._drag_mode == "resize_top":
                 if smart_scale:
                     self._smart_scale_resize_top(minute_at_cursor)
                 else:
-                    snapped = self.day_view.snap_minute(minute_at_cursor)
+                    snapped = dv.snap_minute(minute_at_cursor)
                     new_start = snapped
                     if magnetic:
-                        now_candidate = self.day_view._now_line_snap_candidate(snapped, block_size, exclude=self)
+                        now_candidate = dv._now_line_snap_candidate(snapped, block_size, exclude=self)
                         if now_candidate:
                             new_start = now_candidate[0]
                     direction = -1 if new_start < self.start_min else 1 if new_start > self.start_min else 0
-                    clamped = self.day_view.clamp_start_to_available(new_start, block_size, exclude=self, direction=direction)
+                    clamped = dv.clamp_start_to_available(new_start, block_size, exclude=self, direction=direction)
                     if clamped is not None:
                         self.start_min = clamped
                         self.end_min = self.start_min + block_size
                         self.update_geometry()
-                e.accept()
             elif self._drag_mode == "resize_bottom":
                 if smart_scale:
                     self._smart_scale_resize_bottom(minute_at_cursor)
                 else:
-                    snapped_end = self.day_view.snap_minute(minute_at_cursor)
+                    snapped_end = dv.snap_minute(minute_at_cursor)
                     new_end = snapped_end
                     new_start = new_end - block_size
                     direction = 1 if new_end > self.end_min else -1 if new_end < self.end_min else 0
-                    clamped = self.day_view.clamp_start_to_available(new_start, block_size, exclude=self, direction=direction)
+                    clamped = dv.clamp_start_to_available(new_start, block_size, exclude=self, direction=direction)
                     if clamped is not None:
                         self.start_min = clamped
                         self.end_min = self.start_min + block_size
                         self.update_geometry()
-                e.accept()
 
     def mouseReleaseEvent(self, e):
-        if self.day_view.box_select_mode:
-            if self._group_dragging and e.button() == Qt.MouseButton.LeftButton:
-                self.day_view._finish_group_move()
+        dv = self.day_view
+        dv._flush_pending_drag()  # the release must see the last sample's position
+        button = e.button()
+        if dv.box_select_mode:
+            if self._group_dragging and button == _LEFT:
+                dv._finish_group_move()
                 self._group_dragging = False
                 e.accept()
             else:
                 super().mouseReleaseEvent(e)
             return
-        if self.locked and e.button() == Qt.MouseButton.LeftButton:
+        if self.locked and button == _LEFT:
             self._drag_mode = None
             self._set_idle_cursor()
             e.accept()
             return
-        if e.button() == Qt.MouseButton.LeftButton:
+        if button == _LEFT:
             if self._drag_mode == "move":
                 moved = (self.start_min != self._orig_start) or (self.end_min != self._orig_end)
                 if moved:
-                    self.day_view.note_history_action("Move block")
-                self.day_view.finalize_single_move(self, self._orig_start, self._orig_end)
+                    dv.note_history_action("Move block")
+                dv.finalize_single_move(self, self._orig_start, self._orig_end)
             else:
                 resized = (self.start_min != self._orig_start) or (self.end_min != self._orig_end)
                 if resized:
-                    self.day_view.note_history_action("Resize block")
-                self.day_view.on_block_changed(self)
+                    dv.note_history_action("Resize block")
+                dv.on_block_changed(self)
             self._drag_mode = None; self._set_idle_cursor()
             e.accept()
         else:
@@ -2095,7 +2941,7 @@ class EventWidget(QWidget):
             )
             if changed:
                 self.day_view.note_history_action("Edit block")
-            self.update_geometry(); owner.on_day_changed()
+            self.update_geometry(); self.update(); owner.on_day_changed()
             if old_image and old_image != self.image_rel:
                 owner.try_delete_image_if_unreferenced(old_image)
 
@@ -2158,31 +3004,46 @@ class MiniCalendar(QCalendarWidget):
     def __init__(self, prefs: Prefs, parent=None):
         super().__init__(parent)
         self._prefs = prefs
+        self._today = QDate.currentDate()  # refreshed by MainWindow's minute tick, not per cell
+        self._rebuild_paint_cache()
+
+    def refresh_today(self, today: Optional[QDate] = None):
+        today = today or QDate.currentDate()
+        if today != self._today:
+            self._today = today
+            self.updateCells()
 
     def set_prefs(self, prefs: Prefs):
         self._prefs = prefs
+        self._rebuild_paint_cache()
         self.update()
 
+    def _rebuild_paint_cache(self):
+        self._today_brush = QBrush(self._prefs.cal_today_dot)
+        self._ring_pen = QPen(self._prefs.cal_selected_ring, 2)
+
     def paintCell(self, painter: QPainter, rect: QRect, date: QDate):
         super().paintCell(painter, rect, date)
+        is_today = date == self._today
+        is_selected = date == self.selectedDate()
+        if not (is_today or is_selected):
+            return  # most of the 42 cells: nothing to add, so no painter state to stash
 
         painter.save()
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
         # Today dot (top-right)
-        if date == QDate.currentDate():
+        if is_today:
             r = 4
             cx = rect.right() - r - 3
             cy = rect.top() + r + 3
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QBrush(self._prefs.cal_today_dot))
-            painter.drawEllipse(QPoint(cx, cy), r, r)
+            painter.setBrush(self._today_brush)
+            painter.drawEllipse(cx - r, cy - r, 2 * r, 2 * r)
 
         # Selected ring
-        if date == self.selectedDate():
-            ring_color = self._prefs.cal_selected_ring
-            pen = QPen(ring_color, 2)
-            painter.setPen(pen)
+        if is_selected:
+            painter.setPen(self._ring_pen)
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.drawEllipse(rect.adjusted(4, 4, -4, -4))
 
@@ -2199,20 +3060,60 @@ class MainWindow(QMainWindow):
             self.prefs.magnetic_mode = False
 
         self.events_by_date: Dict[str, List[dict]] = self.load_data()
-        self.repeat_rules: List[dict] = self.load_rules()
+        # data.csv / rules.csv writes are coalesced to one per event-loop pass (see flush_saves)
+        self._data_dirty = False
+        self._rules_dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(0)
+        self._save_timer.timeout.connect(self.flush_saves)
+        self.repeat_rules: List[dict] = self.load_rules()  # DAILY only: load_rules drops other types
+        self._rules_by_id: Dict[str, dict] = {}
+        self._reindex_rules()
+        # image rel path / stripped tag -> number of events_by_date entries and rules using it
+        self._image_refcounts: Dict[str, int] = {}
+        self._tag_counts: Dict[str, int] = {}
+        for items in self.events_by_date.values():
+            self._count_refs(items, 1)
+        self._count_refs(self.repeat_rules, 1)
         self._next_rule_id = self.compute_next_rule_id()
         self.current_date: QDate = QDate.currentDate()
-        self.notification_timers: List[QTimer] = []
+        # Today's reminders as a (trigger ms since epoch, seq, callback) heap behind one timer armed for the head
+        self._notif_heap: List[Tuple[int, int, functools.partial]] = []
+        self._notif_timer = QTimer(self)
+        self._notif_timer.setSingleShot(True)
+        self._notif_timer.timeout.connect(self._fire_due_notifications)
+        # Edits ask for a rebuild through schedule_notification_refresh; one happens per event-loop pass
+        self._notif_refresh_timer = QTimer(self)
+        self._notif_refresh_timer.setSingleShot(True)
+        self._notif_refresh_timer.setInterval(0)
+        self._notif_refresh_timer.timeout.connect(self.refresh_notifications)
         self._notification_schedule_date: Optional[QDate] = None
+        self._last_now_line_state: Optional[Tuple[bool, int]] = None  # (viewing today, minute) last drawn
+        self._last_tag_totals: Optional[Tuple[Tuple[str, int], ...]] = None  # what tag_totals_list shows
         self.notification_player: Optional[QMediaPlayer] = None
         self.notification_audio: Optional[QAudioOutput] = None
+        self._player_source: Optional[Path] = None  # what notification_player was last pointed at
+        self._notify_sound_file = self._resolve_sound_file(self.prefs.notify_sound_path)
         self.tray_icon: Optional[QSystemTrayIcon] = None
-        self._history: List[dict] = []
+        self._history: List[HistorySnapshot] = []
+        self._display_history: Optional[List[dict]] = None  # built by _history_entries_for_dialog
         self._history_index: int = -1
         self._history_freeze: bool = False
         self._history_max: int = 11  # baseline + 10 actions
         self._pending_history_action: Optional[str] = None
+        # Data rows in history.csv, or None when the file may not mirror _history (forces a rewrite)
+        self._history_log_rows: Optional[int] = None
         self._clear_history_file()
+        # Widgets the toolbar handlers touch; None until built below (checked with `is not None`)
+        self.day_view: Optional[DayView] = None
+        self.calendar: Optional[MiniCalendar] = None
+        self.tag_totals_list: Optional[QListWidget] = None
+        self.time_size_combo: Optional[QComboBox] = None
+        self.smart_scale_btn: Optional[QToolButton] = None
+        self.magnetic_btn: Optional[QToolButton] = None
+        self.snap_toggle: Optional[QToolButton] = None
+        self.box_select_btn: Optional[QToolButton] = None
 
         # Menus
         menu = self.menuBar(); edit_menu = menu.addMenu("Edit")
@@ -2223,12 +3124,7 @@ class MainWindow(QMainWindow):
         tb = QToolBar("Controls", self); tb.setMovable(False); self.addToolBar(tb)
         tb.addWidget(QLabel("  Time Size: "))
         self.time_size_combo = QComboBox()
-        snap_values = []
-        for val in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 22, 24, 30, 60]:
-            text = str(val)
-            if text not in snap_values:
-                snap_values.append(text)
-        self.time_size_combo.addItems(snap_values)
+        self.time_size_combo.addItems(TIME_SIZE_CHOICES)
         self.time_size_combo.setCurrentText(str(self.prefs.time_size_minutes))
         self.time_size_combo.currentTextChanged.connect(self.on_time_size_changed)
         tb.addWidget(self.time_size_combo)
@@ -2292,23 +3188,7 @@ class MainWindow(QMainWindow):
         self.day_view.set_snap_enabled(self.prefs.time_snap_enabled)
         self.day_view.set_magnetic_mode(self.prefs.magnetic_mode)
         self.day_view.set_smart_scale_enabled(self.prefs.smart_scale_enabled)
-        if hasattr(self, "snap_toggle"):
-            self.snap_toggle.blockSignals(True)
-            self.snap_toggle.setChecked(self.prefs.time_snap_enabled)
-            self.snap_toggle.blockSignals(False)
-        if hasattr(self, "time_size_combo"):
-            self.time_size_combo.blockSignals(True)
-            self.time_size_combo.setCurrentText(str(self.prefs.time_size_minutes))
-            self.time_size_combo.blockSignals(False)
-        if hasattr(self, "smart_scale_btn"):
-            self.smart_scale_btn.blockSignals(True)
-            self.smart_scale_btn.setChecked(bool(self.prefs.smart_scale_enabled))
-            self.smart_scale_btn.blockSignals(False)
-        if hasattr(self, "magnetic_btn"):
-            self.magnetic_btn.blockSignals(True)
-            self.magnetic_btn.setChecked(bool(self.prefs.magnetic_mode))
-            self.magnetic_btn.blockSignals(False)
-        self.update_snap_toggle_text()
+        self._sync_toolbar_from_prefs()
         self._init_shortcuts()
 
         # Calendar dock (left) with "Go to current time" button
@@ -2364,9 +3244,7 @@ class MainWindow(QMainWindow):
     def center_on_minute(self, minute: int):
         y = self.day_view.minute_to_y(minute)
         sb = self.scroll_area.verticalScrollBar()
-        target = int(y - self.scroll_area.viewport().height() / 2)
-        target = max(0, min(target, sb.maximum()))
-        sb.setValue(target)
+        sb.setValue(int(y - self.scroll_area.viewport().height() / 2))  # setValue clamps to the range
 
     def center_on_current_time(self):
         now = QTime.currentTime()
@@ -2381,33 +3259,28 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(0, self.center_on_current_time)
 
     def _format_minutes_compact(self, minutes: int) -> str:
-        minutes = max(0, int(minutes))
-        h, m = divmod(minutes, 60)
-        parts: List[str] = []
-        if h:
-            parts.append(f"{h}h")
-        if m or not parts:
-            parts.append(f"{m}m")
-        return " ".join(parts)
+        return _fmt_duration(int(minutes))
 
     def rebuild_tag_totals(self):
         totals: Dict[str, int] = {}
-        for ev in getattr(self.day_view, "event_widgets", []):
-            tag = (getattr(ev, "tag", "") or "").strip()
-            if not tag:
-                continue
-            duration = max(0, ev.end_min - ev.start_min)
-            totals[tag] = totals.get(tag, 0) + duration
-        items = [(tag, totals[tag]) for tag in sorted(totals.keys(), key=lambda s: s.lower())]
-        if hasattr(self, "tag_totals_list"):
-            self.tag_totals_list.blockSignals(True)
-            self.tag_totals_list.clear()
-            if not items:
-                self.tag_totals_list.addItem("No tagged events today")
-            else:
-                for tag, minutes in items:
-                    self.tag_totals_list.addItem(f"{tag}: {self._format_minutes_compact(minutes)}")
-            self.tag_totals_list.blockSignals(False)
+        get = totals.get
+        for ev in self.day_view.event_widgets:
+            tag = ev.tag  # EventWidget keeps tags stripped ("" when untagged)
+            if tag:
+                totals[tag] = get(tag, 0) + max(0, ev.end_min - ev.start_min)
+        items = tuple((tag, totals[tag]) for tag in sorted(totals.keys(), key=str.lower))
+        if items == self._last_tag_totals:
+            return  # most drags/edits leave the per-tag sums untouched
+        if self.tag_totals_list is not None:
+            self._last_tag_totals = items
+            lines = [f"{tag}: {self._format_minutes_compact(minutes)}" for tag, minutes in items]
+            w = self.tag_totals_list
+            w.setUpdatesEnabled(False)
+            w.blockSignals(True)
+            w.clear()
+            w.addItems(lines or ["No tagged events today"])
+            w.blockSignals(False)
+            w.setUpdatesEnabled(True)
 
     def open_tag_editor(self):
         tags = self.known_tags()
@@ -2453,46 +3326,50 @@ class MainWindow(QMainWindow):
             minutes = self.day_view.time_size_minutes
         minutes = max(1, minutes)
         self.prefs.time_size_minutes = minutes
-        if hasattr(self, "day_view"):
+        if self.day_view is not None:
             self.day_view.set_time_size(minutes)
         self.statusBar().showMessage(f"Time size set to {minutes} min", 1500)
+    def _sync_toolbar_from_prefs(self):
+        """Mirror prefs into the toolbar controls without firing their change handlers."""
+        with blocked_signals(self.snap_toggle, self.time_size_combo, self.smart_scale_btn, self.magnetic_btn):
+            self.snap_toggle.setChecked(self.prefs.time_snap_enabled)
+            self.time_size_combo.setCurrentText(str(self.prefs.time_size_minutes))
+            self.smart_scale_btn.setChecked(bool(self.prefs.smart_scale_enabled))
+            self.magnetic_btn.setChecked(bool(self.prefs.magnetic_mode))
+        self.update_snap_toggle_text()
+
     def update_snap_toggle_text(self):
-        if getattr(self, "snap_toggle", None) is None:
+        if self.snap_toggle is None:
             return
         self.snap_toggle.setText("Snap On" if self.snap_toggle.isChecked() else "Snap Off")
     def on_snap_toggle(self, checked: bool):
         self.prefs.time_snap_enabled = bool(checked)
-        self.prefs.save(PREF_PATH)
-        if hasattr(self, "day_view"):
+        if self.day_view is not None:
             self.day_view.set_snap_enabled(bool(checked))
         self.update_snap_toggle_text()
         msg = "Time snap enabled" if checked else "Time snap disabled"
         self.statusBar().showMessage(msg, 1500)
     def on_smart_scale_toggled(self, checked: bool):
         self.prefs.smart_scale_enabled = bool(checked)
-        self.prefs.save(PREF_PATH)
-        if checked and getattr(self, "magnetic_btn", None):
-            self.magnetic_btn.blockSignals(True)
-            self.magnetic_btn.setChecked(False)
-            self.magnetic_btn.blockSignals(False)
+        if checked and self.magnetic_btn is not None:
+            with blocked_signals(self.magnetic_btn):
+                self.magnetic_btn.setChecked(False)
             self.prefs.magnetic_mode = False
-            if hasattr(self, "day_view"):
+            if self.day_view is not None:
                 self.day_view.set_magnetic_mode(False)
-        if hasattr(self, "day_view"):
+        if self.day_view is not None:
             self.day_view.set_smart_scale_enabled(bool(checked))
         msg = "Smart scale on" if checked else "Smart scale off"
         self.statusBar().showMessage(msg, 1500)
     def on_magnetic_toggled(self, checked: bool):
         self.prefs.magnetic_mode = bool(checked)
-        self.prefs.save(PREF_PATH)
-        if checked and getattr(self, "smart_scale_btn", None):
-            self.smart_scale_btn.blockSignals(True)
-            self.smart_scale_btn.setChecked(False)
-            self.smart_scale_btn.blockSignals(False)
+        if checked and self.smart_scale_btn is not None:
+            with blocked_signals(self.smart_scale_btn):
+                self.smart_scale_btn.setChecked(False)
             self.prefs.smart_scale_enabled = False
-            if hasattr(self, "day_view"):
+            if self.day_view is not None:
                 self.day_view.set_smart_scale_enabled(False)
-        if hasattr(self, "day_view"):
+        if self.day_view is not None:
             self.day_view.set_magnetic_mode(bool(checked))
         msg = "Magnetic mode on" if checked else "Magnetic mode off"
         self.statusBar().showMessage(msg, 1500)
@@ -2500,10 +3377,10 @@ class MainWindow(QMainWindow):
         self.prefs.time_24h = (text.strip() == "24h"); self.prefs.save(PREF_PATH)
         self.day_view.set_prefs(self.prefs)
     def on_zoom_changed(self, val: int):
-        self.zoom_label.setText(f"{val}%"); self.prefs.zoom_percent = int(val); self.prefs.save(PREF_PATH)
+        self.zoom_label.setText(f"{val}%"); self.prefs.zoom_percent = int(val); self.day_view.schedule_prefs_save()
         self.day_view.set_zoom_from_percent(val)
     def on_box_select_toggled(self, checked: bool):
-        if hasattr(self, "day_view"):
+        if self.day_view is not None:
             self.day_view.set_box_select_mode(bool(checked))
         msg = "Box select enabled" if checked else "Box select disabled"
         self.statusBar().showMessage(msg, 1500)
@@ -2512,17 +3389,18 @@ class MainWindow(QMainWindow):
             label = "event" if count == 1 else "events"
             total_text = self.day_view._format_remaining_minutes(total_minutes)
             self.statusBar().showMessage(f"{count} {label} selected • {total_text} total", 2500)
-        elif getattr(self, "box_select_btn", None) and self.box_select_btn.isChecked():
+        elif self.box_select_btn is not None and self.box_select_btn.isChecked():
             self.statusBar().showMessage("No events selected", 1500)
     def _history_entries_for_dialog(self) -> List[dict]:
-        display_entries: List[dict] = []
-        for idx, entry in enumerate(self._history):
-            if entry.get("action") == "Initial load":
-                continue
-            cloned = dict(entry)
-            cloned["_history_index"] = idx
-            display_entries.append(cloned)
-        return display_entries
+        """_history minus the baseline, tagged with _history_index; cached until _history changes."""
+        if self._display_history is None:
+            display_entries: List[dict] = []
+            for idx, entry in enumerate(self._history):
+                if entry.action == "Initial load":
+                    continue
+                display_entries.append(entry.as_entry(idx))
+            self._display_history = display_entries
+        return self._display_history
 
     def show_history_dialog(self):
         display_entries = self._history_entries_for_dialog()
@@ -2544,8 +3422,9 @@ class MainWindow(QMainWindow):
         finally:
             self._history_freeze = False
         self._pending_history_action = None
-        label = snapshot.get("action", "History restored")
-        self._write_history_file()
+        label = snapshot.action or "History restored"
+        if self._history_log_rows is None:  # restoring moves the index only; the entries are unchanged
+            self._write_history_file()
         self.statusBar().showMessage(f"Restored: {label}", 2000)
     def perform_undo(self):
         if self._history_index <= 0 or not self._history:
@@ -2575,6 +3454,7 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage("Redo complete", 1500)
     def clear_history_entries(self) -> List[dict]:
         self._history = []
+        self._display_history = None
         self._history_index = -1
         self._pending_history_action = None
         self._history_freeze = False
@@ -2587,32 +3467,22 @@ class MainWindow(QMainWindow):
         dlg = PreferencesDialog(self.prefs, self)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             self.prefs = dlg.result_prefs(); self.prefs.save(PREF_PATH)
+            self._notify_sound_file = self._resolve_sound_file(self.prefs.notify_sound_path)
             self.time_combo.setCurrentText("24h" if self.prefs.time_24h else "12h")
             self.zoom_slider.setValue(int(self.prefs.zoom_percent))
             self.day_view.set_prefs(self.prefs)
             self.calendar.set_prefs(self.prefs)
-            if hasattr(self, "time_size_combo"):
-                self.time_size_combo.blockSignals(True)
-                self.time_size_combo.setCurrentText(str(self.prefs.time_size_minutes))
-                self.time_size_combo.blockSignals(False)
-            if hasattr(self, "snap_toggle"):
-                self.snap_toggle.blockSignals(True)
-                self.snap_toggle.setChecked(self.prefs.time_snap_enabled)
-                self.snap_toggle.blockSignals(False)
-            if hasattr(self, "magnetic_btn"):
-                self.magnetic_btn.blockSignals(True)
-                self.magnetic_btn.setChecked(bool(self.prefs.magnetic_mode))
-                self.magnetic_btn.blockSignals(False)
-            if hasattr(self, "smart_scale_btn"):
-                self.smart_scale_btn.blockSignals(True)
-                self.smart_scale_btn.setChecked(bool(self.prefs.smart_scale_enabled))
-                self.smart_scale_btn.blockSignals(False)
-            self.update_snap_toggle_text()
+            self._sync_toolbar_from_prefs()
             self.day_view.set_magnetic_mode(self.prefs.magnetic_mode)
             self.day_view.set_smart_scale_enabled(self.prefs.smart_scale_enabled)
 
     # date helpers
-    def date_key(self, qd: QDate) -> str: return qd.toString("yyyy-MM-dd")
+    def date_key(self, qd: QDate) -> str:
+        """`qd` as "yyyy-MM-dd"; formatted in Python from one getDate() call instead of QDate.toString."""
+        y, m, d = qd.getDate()
+        if y <= 0:  # invalid (0, 0, 0) or BCE dates: keep Qt's exact output ("" / "-0005-...")
+            return qd.toString("yyyy-MM-dd")
+        return f"{y:04d}-{m:02d}-{d:02d}"
     def update_date_label(self): self.date_label.setText(f"  Viewing: <b>{self.current_date.toString('dddd, MMM d, yyyy')}</b>")
 
     # calendar change
@@ -2623,12 +3493,29 @@ class MainWindow(QMainWindow):
 
     # now line
     def update_now_line(self):
-        is_today = (self.current_date == QDate.currentDate())
-        self.day_view.show_now_line = is_today
-        self.day_view.update()
-        for ev in self.day_view.event_widgets:
-            ev.update()
         actual_today = QDate.currentDate()
+        is_today = (self.current_date == actual_today)
+        self.calendar.refresh_today(actual_today)
+        now = QTime.currentTime()
+        state = (is_today, now.hour() * 60 + now.minute())
+        last = self._last_now_line_state
+        # Nothing moves on another day's view, or twice within the same minute
+        if state != last and (is_today or last is None or last[0]):
+            self.day_view.show_now_line = is_today
+            toggled = last is None or last[0] != is_today
+            minute = state[1]
+            if toggled:
+                self.day_view.update()
+            else:
+                self.day_view.update_now_band(last[1], minute)  # erase the old line, draw the new one
+            self.day_view.refresh_indicator()
+            # REM text only changes on blocks overlapping the span since the last tick; the span
+            # can cover several minutes after a sleep or a stalled loop, so blocks that ended inside it repaint too
+            lo, hi = (0, MAX_MINUTE) if toggled else (min(last[1], minute), max(last[1], minute))
+            for ev in self.day_view.visible_blocks():
+                if ev.start_min <= hi and ev.end_min >= lo:
+                    ev.update()
+        self._last_now_line_state = state
         if self._notification_schedule_date != actual_today:
             self.refresh_notifications()
 
@@ -2661,15 +3548,25 @@ class MainWindow(QMainWindow):
         return True
 
     def clear_notification_timers(self):
-        for t in self.notification_timers:
-            try:
-                t.stop()
-            except Exception:
-                pass
-            t.deleteLater()
-        self.notification_timers.clear()
+        self._notif_timer.stop()
+        self._notif_heap.clear()
+
+    def _arm_notification_timer(self):
+        if self._notif_heap:
+            self._notif_timer.start(max(0, self._notif_heap[0][0] - QDateTime.currentMSecsSinceEpoch()))
+
+    def _fire_due_notifications(self):
+        now_ms = QDateTime.currentMSecsSinceEpoch()
+        heap = self._notif_heap
+        while heap and heap[0][0] <= now_ms:
+            heapq.heappop(heap)[2]()
+        self._arm_notification_timer()  # also covers a timer that woke a little early
+
+    def schedule_notification_refresh(self):
+        self._notif_refresh_timer.start()
 
     def refresh_notifications(self):
+        self._notif_refresh_timer.stop()  # a direct call satisfies any pending scheduled one
         self.clear_notification_timers()
         today = QDate.currentDate()
         self._notification_schedule_date = today
@@ -2677,104 +3574,96 @@ class MainWindow(QMainWindow):
             return
         now = QDateTime.currentDateTime()
         key = self.date_key(today)
-        scheduled: List[tuple[str, int, int, Optional[str]]] = []
-        for item in self.events_by_date.get(key, []):
-            try:
-                start_min = int(item.get("start_min", 0))
-            except Exception:
-                continue
-            offset = int(item.get("notify_offset", 0))
-            if offset <= 0:
-                continue
-            image_rel = (item.get("image") or "").strip() or None
-            scheduled.append((item.get("title", ""), start_min, offset, image_rel))
-        for r in self.repeat_rules:
-            if str(r.get("type", "")).upper() != "DAILY":
-                continue
-            offset = int(r.get("notify_offset", 0))
-            if offset <= 0:
-                continue
+        heap = self._notif_heap
+        push = heapq.heappush
+        notify = self.show_notification_for_event
+        day_events = self.events_by_date.get(key, [])
+        for item in itertools.chain(day_events, self.repeat_rules):
+            get = item.get
             try:
-                start_min = int(r.get("start_min", 0))
+                offset = int(get("notify_offset", 0))
+                if offset <= 0:
+                    continue  # most entries have no reminder; skip them before any other parsing
+                start_min = int(get("start_min", 0))
             except Exception:
                 continue
-            image_rel = (r.get("image") or "").strip() or None
-            scheduled.append((r.get("title", ""), start_min, offset, image_rel))
-
-        for title, start_min, offset, image_rel in scheduled:
-            if start_min < 0 or start_min >= 24 * 60:
+            if start_min < 0 or start_min > MAX_MINUTE:
                 continue
             trigger_minute = start_min - offset
             if trigger_minute < 0:
                 continue
-            trigger_time = QTime(trigger_minute // 60, trigger_minute % 60)
-            trigger_dt = QDateTime(today, trigger_time)
+            trigger_dt = QDateTime(today, QTime(trigger_minute // 60, trigger_minute % 60))
             if trigger_dt <= now:
                 continue
-            msecs = now.msecsTo(trigger_dt)
-            timer = QTimer(self)
-            timer.setSingleShot(True)
-            timer.timeout.connect(lambda t=title, s=start_min, img=image_rel: self.show_notification_for_event(t, s, img))
-            timer.start(msecs)
-            self.notification_timers.append(timer)
-
-    def show_notification_for_event(self, title: str, start_min: int, image_rel: Optional[str] = None,
+            image_rel = (get("image") or "").strip() or None
+            # Resolve (and stat) the image now so firing goes straight to the notifier
+            push(heap, (trigger_dt.toMSecsSinceEpoch(), len(heap),
+                        functools.partial(notify, get("title", ""), start_min, resolve_image_path(image_rel))))
+        self._arm_notification_timer()
+
+    def show_notification_for_event(self, title: str, start_min: int, image_path: Optional[str] = None,
                                     sound_path: Optional[str] = None):
         if sys.platform == "darwin":
-            self.show_mac_notification(title, start_min, image_rel=image_rel, sound_path=sound_path)
+            self.show_mac_notification(title, start_min, image_path=image_path, sound_path=sound_path)
         elif sys.platform.startswith("win"):
-            self.show_windows_notification(title, start_min, image_rel=image_rel, sound_path=sound_path)
+            self.show_windows_notification(title, start_min, image_path=image_path, sound_path=sound_path)
 
-    def show_mac_notification(self, title: str, start_min: int, image_rel: Optional[str] = None,
+    def show_mac_notification(self, title: str, start_min: int, image_path: Optional[str] = None,
                               sound_path: Optional[str] = None):
+        """`image_path` is an absolute, already-checked path (see resolve_image_path)."""
         if sys.platform != "darwin":
             return
-        safe_start = max(0, min(24 * 60 - 1, int(start_min)))
+        start_min = int(start_min)
+        safe_start = 0 if start_min < 0 else (MAX_MINUTE if start_min > MAX_MINUTE else start_min)
         event_title = (title or "Upcoming event").strip() or "Upcoming event"
         time_text = self.day_view.min_to_hhmm(safe_start)
         message = f"{event_title} starts at {time_text}"
-        subtitle = "iCal-ish Reminder"
-
-        image_path: Optional[Path] = None
-        if image_rel:
-            candidate = Path(image_rel)
-            if not candidate.is_absolute():
-                candidate = APP_DIR / candidate
-            if candidate.exists():
-                image_path = candidate
-
-        parts = [
-            f'display notification {json.dumps(message)}',
-            f'with title {json.dumps(event_title)}',
-            f'subtitle {json.dumps(subtitle)}',
-        ]
+
+        fallback = f'display notification {json.dumps(message)} with title {json.dumps(event_title)} {_MAC_SUBTITLE_FRAG}'
+        script = fallback
         if image_path is not None:
-            parts.append(f'content image POSIX file {json.dumps(str(image_path))}')
-        script = " ".join(parts)
-        try:
-            result = subprocess.run(["osascript", "-e", script], check=False)
-            if result.returncode != 0:
-                raise RuntimeError("osascript failed")
-        except Exception:
-            fallback = " ".join(parts[:3])
-            try:
-                subprocess.run(["osascript", "-e", fallback], check=False)
-            except Exception:
-                pass
-        self.play_notification_sound(sound_path)
+            script += f' content image POSIX file {json.dumps(image_path)}'
+        self._run_osascript(script, fallback)
+        if sound_path is not None or self._notify_sound_file is not None:
+            self.play_notification_sound(sound_path)
+
+    def _run_osascript(self, script: str, fallback: Optional[str] = None):
+        """Run `script` without blocking the UI thread; on failure retry once with `fallback`."""
+        proc = QProcess(self)
+
+        def finished(code: int, status: QProcess.ExitStatus):
+            proc.deleteLater()
+            if fallback is not None and (code != 0 or status != QProcess.ExitStatus.NormalExit):
+                self._run_osascript(fallback)
+
+        def failed(error: QProcess.ProcessError):
+            if error == QProcess.ProcessError.FailedToStart:  # no finished() follows
+                proc.deleteLater()
+
+        proc.finished.connect(finished)
+        proc.errorOccurred.connect(failed)
+        proc.setStandardOutputFile(QProcess.nullDevice())
+        proc.setStandardErrorFile(QProcess.nullDevice())
+        proc.start("osascript", ["-e", script])
  
+    @staticmethod
+    def _resolve_sound_file(sound_path: str) -> Optional[Path]:
+        chosen_path = (sound_path or "").strip()
+        if not chosen_path:
+            return None
+        audio_file = Path(chosen_path).expanduser()
+        return audio_file if audio_file.is_file() else None
+
     def play_notification_sound(self, sound_path: Optional[str] = None):
-        chosen_path = ""
+        """Play `sound_path`, or the prefs sound (checked once per prefs change) when None."""
         if sound_path is not None:
-            chosen_path = sound_path.strip()
+            audio_file = self._resolve_sound_file(sound_path)
         else:
-            chosen_path = getattr(self.prefs, "notify_sound_path", "").strip()
-        if not chosen_path:
-            return
-        audio_file = Path(chosen_path).expanduser()
-        if not audio_file.is_file():
+            audio_file = self._notify_sound_file
+        if audio_file is None:
             return
         try:
+            from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
             if self.notification_player is None:
                 self.notification_audio = QAudioOutput(self)
                 if self.notification_audio is not None:
@@ -2783,18 +3672,21 @@ class MainWindow(QMainWindow):
                 self.notification_player.setAudioOutput(self.notification_audio)
             if self.notification_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
                 self.notification_player.stop()
-            self.notification_player.setSource(QUrl.fromLocalFile(str(audio_file)))
+            if audio_file != self._player_source:  # re-opening the same file would re-decode it
+                self.notification_player.setSource(QUrl.fromLocalFile(str(audio_file)))
+                self._player_source = audio_file
             self.notification_player.play()
         except Exception:
             pass
 
-    def show_windows_notification(self, title: str, start_min: int, image_rel: Optional[str] = None,
+    def show_windows_notification(self, title: str, start_min: int, image_path: Optional[str] = None,
                                   sound_path: Optional[str] = None):
         if not sys.platform.startswith("win"):
             return
         if not self.ensure_tray_icon():
             return
-        safe_start = max(0, min(24 * 60 - 1, int(start_min)))
+        start_min = int(start_min)
+        safe_start = 0 if start_min < 0 else (MAX_MINUTE if start_min > MAX_MINUTE else start_min)
         event_title = (title or "Upcoming event").strip() or "Upcoming event"
         time_text = self.day_view.min_to_hhmm(safe_start)
         message = f"{event_title} starts at {time_text}"
@@ -2805,7 +3697,8 @@ class MainWindow(QMainWindow):
                 QSystemTrayIcon.MessageIcon.Information,
                 10000,
             )
-        self.play_notification_sound(sound_path)
+        if sound_path is not None or self._notify_sound_file is not None:
+            self.play_notification_sound(sound_path)
 
     def trigger_test_notification(self, sound_path: str, image_rel: Optional[str] = None):
         chosen = (sound_path or "").strip()
@@ -2819,8 +3712,6 @@ class MainWindow(QMainWindow):
                     break
             if not image_rel:
                 for r in self.repeat_rules:
-                    if str(r.get("type", "")).upper() != "DAILY":
-                        continue
                     rel = (r.get("image") or "").strip()
                     if rel:
                         image_rel = rel
@@ -2831,7 +3722,7 @@ class MainWindow(QMainWindow):
             self.show_mac_notification(
                 "Preferences Test",
                 start_min,
-                image_rel=image_rel,
+                image_path=resolve_image_path(image_rel),
                 sound_path=chosen if chosen else None,
             )
             return
@@ -2841,7 +3732,7 @@ class MainWindow(QMainWindow):
             self.show_windows_notification(
                 "Preferences Test",
                 start_min,
-                image_rel=image_rel,
+                image_path=resolve_image_path(image_rel),
                 sound_path=chosen if chosen else None,
             )
             return
@@ -2863,77 +3754,85 @@ class MainWindow(QMainWindow):
     def add_daily_rule(self, start_min: int, end_min: int, title: str, color_hex: str, locked: bool=False,
                        image_rel: Optional[str]=None, notify_offset: int = 0, tag: str = ""):
         rid = str(self._next_rule_id); self._next_rule_id += 1
-        self.repeat_rules.append({
+        rule = {
             "id": rid, "type": "DAILY",
             "start_min": int(start_min), "end_min": int(end_min),
             "title": title, "color": color_hex, "locked": 1 if locked else 0,
             "image": image_rel or "",
             "tag": tag or "",
             "notify_offset": int(notify_offset),
-        })
+        }
+        self.repeat_rules.append(rule)
+        self._rules_by_id.setdefault(rid, rule)
+        self._count_refs((rule,), 1)
         self.save_rules(); self.load_day(self.current_date)
 
     def update_daily_rule(self, rid: Optional[str], start_min: int, end_min: int, title: str, color_hex: str,
                           image_rel: Optional[str], notify_offset: int, tag: str) -> bool:
-        if rid is None: return False
-        for r in self.repeat_rules:
-            if str(r.get("id")) == str(rid):
-                if int(r.get("locked", 0)) == 1: return False
-                r["start_min"] = int(start_min); r["end_min"] = int(end_min)
-                r["title"] = title; r["color"] = color_hex; r["image"] = image_rel or ""
-                r["notify_offset"] = int(notify_offset); r["tag"] = tag or ""
-                self.save_rules(); return True
-        return False
+        r = self._rule_for(rid)
+        if r is None or int(r.get("locked", 0)) == 1: return False
+        self._count_refs((r,), -1)
+        r["start_min"] = int(start_min); r["end_min"] = int(end_min)
+        r["title"] = title; r["color"] = color_hex; r["image"] = image_rel or ""
+        r["notify_offset"] = int(notify_offset); r["tag"] = tag or ""
+        self._count_refs((r,), 1)
+        self.save_rules(); return True
 
     def delete_daily_rule(self, rid: Optional[str]) -> Optional[str]:
-        if rid is None: return None
-        for i, r in enumerate(self.repeat_rules):
-            if str(r.get("id")) == str(rid):
-                if int(r.get("locked", 0)) == 1: return None
-                img = r.get("image") or None
-                self.repeat_rules.pop(i); self.save_rules(); return img
-        return None
+        r = self._rule_for(rid)
+        if r is None or int(r.get("locked", 0)) == 1: return None
+        # by identity: list.remove() compares dicts by value and could drop an identical twin
+        del self.repeat_rules[next(i for i, x in enumerate(self.repeat_rules) if x is r)]
+        self._count_refs((r,), -1)
+        self._reindex_rules()  # a rule sharing the id (if any) becomes the one lookups find
+        self.save_rules(); return r.get("image") or None
 
     def delete_daily_rule_with_cleanup(self, rid: Optional[str]):
         img = self.delete_daily_rule(rid)
         if img: self.try_delete_image_if_unreferenced(img)
 
     def rule_locked(self, rid: Optional[str]) -> bool:
-        if rid is None: return False
-        for r in self.repeat_rules:
-            if str(r.get("id")) == str(rid): return int(r.get("locked", 0)) == 1
-        return False
+        r = self._rule_for(rid)
+        return r is not None and int(r.get("locked", 0)) == 1
 
     def set_rule_locked(self, rid: Optional[str], locked: bool):
-        if rid is None: return
+        r = self._rule_for(rid)
+        if r is not None:
+            r["locked"] = 1 if locked else 0; self.save_rules()
+
+    def _rule_for(self, rid: Optional[str]) -> Optional[dict]:
+        return self._rules_by_id.get(rid)  # ids are str from load_rules/add_daily_rule on; None never matches
+
+    def _reindex_rules(self):
+        """Rebuild the id -> rule map; the first rule wins on a repeated id, as the linear scans did."""
+        index: Dict[str, dict] = {}
         for r in self.repeat_rules:
-            if str(r.get("id")) == str(rid):
-                r["locked"] = 1 if locked else 0; self.save_rules(); return
+            index.setdefault(r["id"], r)
+        self._rules_by_id = index
 
     def load_rules(self) -> List[dict]:
         rules: List[dict] = []
         if not RULES_PATH.exists(): return rules
         try:
             with RULES_PATH.open("r", encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    rtype = (row.get("type") or "").strip().upper()
-                    if rtype == "DAILY":
-                        try:
-                            rules.append({
-                                "id": row.get("id") or "0",
-                                "type": "DAILY",
-                                "start_min": int(row.get("start_min", 0)),
-                                "end_min": int(row.get("end_min", 0)),
-                                "title": row.get("title", ""),
-                                "tag": row.get("tag", "") or "",
-                                "color": row.get("color", "#4879C5"),
-                                "locked": int(row.get("locked", "0")),
-                                "image": row.get("image", ""),
-                                "notify_offset": int(row.get("notify_offset", 0)),
-                            })
-                        except Exception:
-                            continue
+                for rid, rtype, sm, em, title, tag, color, locked, image, offset in _csv_records(csv.reader(f), RULES_COLUMNS):
+                    if (rtype or "").strip().upper() != "DAILY":
+                        continue
+                    try:
+                        rules.append({
+                            "id": rid or "0",  # always a str; _rules_by_id and rule_id rely on it
+                            "type": "DAILY",
+                            "start_min": int(sm),
+                            "end_min": int(em),
+                            "title": title,
+                            "tag": tag or "",
+                            "color": color,
+                            "locked": int(locked),
+                            "image": image,
+                            "notify_offset": int(offset),
+                        })
+                    except (TypeError, ValueError):
+                        continue
         except Exception as e:
             QMessageBox.warning(self, "Load Rules Error", f"Failed to load rules.csv: {e}")
         changed = False; next_id = 1
@@ -2945,19 +3844,38 @@ class MainWindow(QMainWindow):
         return rules
 
     def save_rules(self):
+        """Mark rules.csv stale; the write happens once, on the next pass of the event loop."""
+        self._rules_dirty = True
+        self._save_timer.start()
+
+    def save_all_data(self):
+        """Mark data.csv stale; the write happens once, on the next pass of the event loop."""
+        self._data_dirty = True
+        self._save_timer.start()
+
+    def flush_saves(self):
+        """Write whichever of data.csv / rules.csv has pending changes, right now."""
+        self._save_timer.stop()
+        if self._data_dirty:
+            self._data_dirty = False
+            self._write_all_data()
+        if self._rules_dirty:
+            self._rules_dirty = False
+            self._write_rules()
+
+    def _write_rules(self):
         try:
-            with RULES_PATH.open("w", encoding="utf-8", newline="") as f:
-                fieldnames = ["id", "type", "start_min", "end_min", "title", "tag", "color", "locked", "image", "notify_offset"]
-                writer = csv.DictWriter(f, fieldnames=fieldnames); writer.writeheader()
-                for r in self.repeat_rules:
-                    writer.writerow({
-                        "id": r.get("id", ""), "type": r.get("type", "DAILY"),
-                        "start_min": r.get("start_min", 0), "end_min": r.get("end_min", 0),
-                        "title": r.get("title", ""), "tag": r.get("tag", "") or "",
-                        "color": r.get("color", "#4879C5"),
-                        "locked": r.get("locked", 0), "image": r.get("image", ""),
-                        "notify_offset": r.get("notify_offset", 0),
-                    })
+            with _atomic_open(RULES_PATH) as f:
+                writer = csv.writer(f); writer.writerow(RULES_COLUMNS)
+                writer.writerows(
+                    (r.get("id", ""), r.get("type", "DAILY"),
+                     r.get("start_min", 0), r.get("end_min", 0),
+                     r.get("title", ""), r.get("tag", "") or "",
+                     r.get("color", "#4879C5"),
+                     r.get("locked", 0), r.get("image", ""),
+                     r.get("notify_offset", 0))
+                    for r in self.repeat_rules
+                )
         except Exception as e:
             QMessageBox.warning(self, "Save Rules Error", f"Failed to save rules.csv: {e}")
 
@@ -2967,60 +3885,58 @@ class MainWindow(QMainWindow):
         if not DATA_PATH.exists(): return result
         try:
             with DATA_PATH.open("r", encoding="utf-8", newline="") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    key = row.get("date", "")
+                for key, sm, em, title, tag, color, locked, image, offset in _csv_records(csv.reader(f), DATA_COLUMNS):
                     if not key:
                         continue
-                    if key not in result:
-                        result[key] = []
+                    items = result.get(key)
+                    if items is None:
+                        items = result[key] = []
                     try:
-                        result[key].append({
-                            "start_min": int(row.get("start_min", 0)),
-                            "end_min": int(row.get("end_min", 0)),
-                            "title": row.get("title", ""),
-                            "tag": row.get("tag", "") or "",
-                            "color": row.get("color", "#4879C5"),
-                            "locked": int(row.get("locked", "0")),
-                            "image": row.get("image", ""),
-                            "notify_offset": int(row.get("notify_offset", 0)),
+                        items.append({
+                            "start_min": int(sm),
+                            "end_min": int(em),
+                            "title": title,
+                            "tag": tag or "",
+                            "color": color,
+                            "locked": int(locked),
+                            "image": image,
+                            "notify_offset": int(offset),
                         })
-                    except Exception:
+                    except (TypeError, ValueError):
                         continue
         except Exception as e:
             QMessageBox.warning(self, "Load Error", f"Failed to load data.csv: {e}")
-        return result
+        return dict(sorted(result.items()))  # keys stay in date order from here on (see _store_day)
 
-    def save_all_data(self):
+    def _write_all_data(self):
         try:
-            with DATA_PATH.open("w", encoding="utf-8", newline="") as f:
-                fieldnames = ["date", "start_min", "end_min", "title", "tag", "color", "locked", "image", "notify_offset"]
-                writer = csv.DictWriter(f, fieldnames=fieldnames); writer.writeheader()
-                for date_key, items in sorted(self.events_by_date.items()):
-                    for it in items:
-                        writer.writerow({
-                            "date": date_key,
-                            "start_min": it["start_min"], "end_min": it["end_min"],
-                            "title": it.get("title", ""), "tag": it.get("tag", "") or "",
-                            "color": it.get("color", "#4879C5"),
-                            "locked": int(it.get("locked", 0)), "image": it.get("image", "") or "",
-                            "notify_offset": int(it.get("notify_offset", 0)),
-                        })
+            with _atomic_open(DATA_PATH) as f:
+                writer = csv.writer(f); writer.writerow(DATA_COLUMNS)
+                writer.writerows(
+                    (date_key,
+                     it["start_min"], it["end_min"],
+                     it.get("title", ""), it.get("tag", "") or "",
+                     it.get("color", "#4879C5"),
+                     int(it.get("locked", 0)), it.get("image", "") or "",
+                     int(it.get("notify_offset", 0)))
+                    for date_key, items in self.events_by_date.items()  # already in date order
+                    for it in items
+                )
         except Exception as e:
             QMessageBox.warning(self, "Save Error", f"Failed to save data.csv: {e}")
 
     def save_day(self, qdate: QDate):
-        key = self.date_key(qdate); data = []
-        for ev in self.day_view.event_widgets:
-            if getattr(ev, "from_rule", False): continue
-            data.append({
-                "start_min": ev.start_min, "end_min": ev.end_min, "title": ev.title,
-                "tag": getattr(ev, "tag", "") or "",
-                "color": qcolor_to_hex(ev.color), "locked": 1 if ev.locked else 0,
-                "image": ev.image_rel or "",
-                "notify_offset": int(getattr(ev, "notify_offset", 0)),
-            })
-        self.events_by_date[key] = data; self.save_all_data()
+        key = self.date_key(qdate)
+        data = [{
+            "start_min": ev.start_min, "end_min": ev.end_min, "title": ev.title,
+            "tag": ev.tag,
+            "color": qcolor_to_hex(ev.color), "locked": 1 if ev.locked else 0,
+            "image": ev.image_rel or "",
+            "notify_offset": ev.notify_offset,
+        } for ev in self.day_view.event_widgets if not ev.from_rule]
+        if data == self.events_by_date.get(key):
+            return  # a no-op edit (click, zero-distance drag): keep the model and skip the rewrite
+        self._set_day_events(key, data); self.save_all_data()
 
     def load_day(self, qdate: QDate, reset_history: bool = True):
         self.day_view.clear_blocks(); key = self.date_key(qdate)
@@ -3035,21 +3951,20 @@ class MainWindow(QMainWindow):
             )
         # rules
         for r in self.repeat_rules:
-            if r.get("type") == "DAILY":
-                color = hex_to_qcolor(r.get("color", "#4879C5"), "#4879C5")
-                self.day_view.add_block(
-                    r["start_min"], r["end_min"] - r["start_min"], r.get("title", ""), color,
-                    from_rule=True, rule_id=str(r.get("id")), locked=bool(int(r.get("locked", 0))),
-                    image_rel=r.get("image") or None, tag=r.get("tag", "") or "",
-                    notify_offset=int(r.get("notify_offset", 0)), record_history=False
-                )
+            color = hex_to_qcolor(r.get("color", "#4879C5"), "#4879C5")
+            self.day_view.add_block(
+                r["start_min"], r["end_min"] - r["start_min"], r.get("title", ""), color,
+                from_rule=True, rule_id=r["id"], locked=bool(int(r.get("locked", 0))),
+                image_rel=r.get("image") or None, tag=r.get("tag", "") or "",
+                notify_offset=int(r.get("notify_offset", 0)), record_history=False
+            )
         self.day_view.update()
-        self.refresh_notifications()
+        self.schedule_notification_refresh()
         if reset_history:
             self._reset_history(qdate)
         self.rebuild_tag_totals()
 
-    def _history_snapshot(self, qdate: Optional[QDate] = None) -> Optional[dict]:
+    def _history_snapshot(self, qdate: Optional[QDate] = None) -> Optional[HistorySnapshot]:
         if not hasattr(self, "events_by_date"):
             return None
         if qdate is None:
@@ -3057,18 +3972,20 @@ class MainWindow(QMainWindow):
         if qdate is None:
             return None
         key = self.date_key(qdate)
-        data = deepcopy(self.events_by_date.get(key, []))
-        return {"date": key, "events": data}
+        # Event dicts only hold ints and strings, so copying each dict is a full deep copy
+        data = [it.copy() for it in self.events_by_date.get(key, ())]
+        return HistorySnapshot(key, data)
 
     def _reset_history(self, qdate: Optional[QDate] = None):
         snap = self._history_snapshot(qdate)
+        self._display_history = None
         if snap is None:
             self._history = []
             self._history_index = -1
             self._write_history_file()
             return
-        snap["action"] = "Initial load"
-        snap["timestamp"] = QDateTime.currentDateTime().toString(Qt.ISODate)
+        snap.action = "Initial load"
+        snap.timestamp = QDateTime.currentDateTime().toString(Qt.ISODate)
         self._history = [snap]
         self._history_index = 0
         self._pending_history_action = None
@@ -3086,31 +4003,33 @@ class MainWindow(QMainWindow):
             return
         action = self._pending_history_action or "Change"
         self._pending_history_action = None
-        snap["action"] = action
-        snap["timestamp"] = QDateTime.currentDateTime().toString(Qt.ISODate)
-        if self._history_index >= 0 and self._history and snap["events"] == self._history[self._history_index].get("events"):
+        snap.action = action
+        snap.timestamp = QDateTime.currentDateTime().toString(Qt.ISODate)
+        if self._history_index >= 0 and self._history and snap.same_events(self._history[self._history_index]):
             return
         if self._history_index < len(self._history) - 1:
             self._history = self._history[:self._history_index + 1]
+            self._history_log_rows = None  # the dropped redo entries are still in the file
         self._history.append(snap)
         self._history_index += 1
         if len(self._history) > self._history_max:
             excess = len(self._history) - self._history_max
             del self._history[:excess]
             self._history_index = max(0, self._history_index - excess)
-        self._write_history_file()
+        self._display_history = None
+        self._append_history_row(snap)
 
-    def _apply_history_snapshot(self, snapshot: dict):
-        if not snapshot:
+    def _apply_history_snapshot(self, snapshot: Optional[HistorySnapshot]):
+        if snapshot is None:
             return
-        key = snapshot.get("date")
+        key = snapshot.date
         if not key:
             return
-        self.events_by_date[key] = deepcopy(snapshot.get("events", []))
+        self._set_day_events(key, [it.copy() for it in snapshot.events])  # flat dicts, see _history_snapshot
         target_date = QDate.fromString(key, "yyyy-MM-dd")
         if target_date.isValid():
             self.current_date = target_date
-            if hasattr(self, "calendar"):
+            if self.calendar is not None:
                 try:
                     self.calendar.blockSignals(True)
                     self.calendar.setSelectedDate(target_date)
@@ -3121,26 +4040,42 @@ class MainWindow(QMainWindow):
         else:
             self.load_day(self.current_date, reset_history=False)
         self.save_all_data()
-        self.refresh_notifications()
+        self.schedule_notification_refresh()
+
+    @staticmethod
+    def _history_row(entry: HistorySnapshot) -> list:
+        return [entry.timestamp, entry.action, entry.date, entry.events_json()]
+
+    def _append_history_row(self, snap: HistorySnapshot):
+        """Log one new step at the end of history.csv; the last 10 rows are always the live history.
+        Rows older than that are only dropped when the file is compacted by _write_history_file."""
+        rows = self._history_log_rows
+        if rows is None or rows == 0 or rows >= HISTORY_LOG_COMPACT_AT:
+            self._write_history_file()
+            return
+        try:
+            with HISTORY_PATH.open("a", encoding="utf-8", newline="") as f:
+                csv.writer(f).writerow(self._history_row(snap))
+            self._history_log_rows = rows + 1
+        except Exception:
+            self._history_log_rows = None
 
     def _write_history_file(self):
-        entries = [entry for entry in self._history if entry.get("action") != "Initial load"]
+        """Rewrite history.csv as exactly the last 10 displayed entries."""
+        entries = self._history_entries_for_dialog()
         if not entries:
             self._clear_history_file()
             return
         entries = entries[-10:]
+        self._history_log_rows = None
         try:
-            with HISTORY_PATH.open("w", encoding="utf-8", newline="") as f:
-                fieldnames = ["timestamp", "action", "date", "events"]
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                for entry in entries:
-                    writer.writerow({
-                        "timestamp": entry.get("timestamp", ""),
-                        "action": entry.get("action", ""),
-                        "date": entry.get("date", ""),
-                        "events": json.dumps(entry.get("events", [])),
-                    })
+            # session-only log (wiped at startup), so atomicity is enough; skip the fsync
+            with _atomic_open(HISTORY_PATH, durable=False) as f:
+                writer = csv.writer(f)
+                writer.writerow(HISTORY_COLUMNS)
+                history = self._history; row = self._history_row
+                writer.writerows(row(history[entry["_history_index"]]) for entry in entries)
+            self._history_log_rows = len(entries)
         except Exception:
             pass
 
@@ -3148,20 +4083,46 @@ class MainWindow(QMainWindow):
         try:
             if HISTORY_PATH.exists():
                 HISTORY_PATH.unlink()
+            self._history_log_rows = 0
         except Exception:
-            pass
+            self._history_log_rows = None
 
 
     # image ref counting / cleanup
+    def _count_refs(self, items, delta: int):
+        """Add `delta` to the image and tag counts of every event or rule dict in `items`."""
+        refs = self._image_refcounts; tags = self._tag_counts
+        for it in items:
+            rel = it.get("image") or ""
+            if rel:
+                n = refs.get(rel, 0) + delta
+                if n > 0: refs[rel] = n
+                else: refs.pop(rel, None)
+            tag = (it.get("tag") or "").strip()
+            if tag:
+                n = tags.get(tag, 0) + delta
+                if n > 0: tags[tag] = n
+                else: tags.pop(tag, None)
+
+    def _store_day(self, key: str, items: List[dict]):
+        """Set a day's list, keeping events_by_date in date-key order so saves need no sort.
+        Only a new key landing before the last one triggers a re-sort, not every save."""
+        by_date = self.events_by_date
+        fresh = key not in by_date
+        last = next(reversed(by_date), None) if fresh else None
+        by_date[key] = items
+        if last is not None and key < last:
+            ordered = sorted(by_date.items())
+            by_date.clear(); by_date.update(ordered)
+
+    def _set_day_events(self, key: str, items: List[dict]):
+        self._count_refs(self.events_by_date.get(key, ()), -1)
+        self._store_day(key, items)
+        self._count_refs(items, 1)
+
     def count_image_references(self, rel_path: str) -> int:
         if not rel_path: return 0
-        count = 0
-        for items in self.events_by_date.values():
-            for it in items:
-                if (it.get("image") or "") == rel_path: count += 1
-        for r in self.repeat_rules:
-            if (r.get("image") or "") == rel_path: count += 1
-        return count
+        return self._image_refcounts.get(rel_path, 0)
 
     def try_delete_image_if_unreferenced(self, rel_path: Optional[str]):
         if not rel_path: return
@@ -3175,42 +4136,33 @@ class MainWindow(QMainWindow):
 
     def on_day_changed(self):
         self.save_day(self.current_date)
-        self.refresh_notifications()
+        self.schedule_notification_refresh()
         self.rebuild_tag_totals()
         self._record_history()
 
     def known_tags(self) -> List[str]:
-        tags: Set[str] = set()
-        for items in self.events_by_date.values():
-            for it in items:
-                tag = (it.get("tag") or "").strip()
-                if tag:
-                    tags.add(tag)
-        for ev in getattr(self.day_view, "event_widgets", []):
-            tag = (getattr(ev, "tag", "") or "").strip()
-            if tag:
-                tags.add(tag)
-        for r in self.repeat_rules:
-            tag = (r.get("tag") or "").strip()
-            if tag:
-                tags.add(tag)
-        return sorted(tags, key=lambda s: s.lower())
+        tags: Set[str] = set(self._tag_counts)  # saved events and rules
+        tags.update(ev.tag for ev in self.day_view.event_widgets if ev.tag)  # unsaved edits on this day
+        return sorted(tags, key=str.lower)
 
     def _remove_tags_from_all(self, tags_to_remove: Set[str]) -> bool:
         normalized = {t.strip() for t in tags_to_remove if t and t.strip()}
         if not normalized:
             return False
         events_changed = False
-        for items in self.events_by_date.values():
-            for it in items:
-                if (it.get("tag") or "").strip() in normalized:
-                    it["tag"] = ""
-                    events_changed = True
         rules_changed = False
-        for r in self.repeat_rules:
-            if (r.get("tag") or "").strip() in normalized:
-                r["tag"] = ""
-                rules_changed = True
+        # _tag_counts covers every saved event and rule, so a miss there means nothing to scan
+        # (the current day's widgets can still carry an unsaved tag and are checked below)
+        if not normalized.isdisjoint(self._tag_counts):
+            for items in self.events_by_date.values():
+                for it in items:
+                    if (it.get("tag") or "").strip() in normalized:
+                        it["tag"] = ""
+                        events_changed = True
+            for r in self.repeat_rules:
+                if (r.get("tag") or "").strip() in normalized:
+                    r["tag"] = ""
+                    rules_changed = True
         view_changed = False
         for ev in getattr(self.day_view, "event_widgets", []):
             if (ev.tag or "").strip() in normalized:
@@ -3221,39 +4173,63 @@ class MainWindow(QMainWindow):
             self.save_all_data()
         if rules_changed:
             self.save_rules()
+        for tag in normalized:
+            self._tag_counts.pop(tag, None)  # every event/rule carrying it was just cleared
         return events_changed or rules_changed or view_changed
 
     def duplicate_weekly(self, start_min: int, end_min: int, title: str, color_hex: str,
                           wdys: List[int], weeks: int, image_rel: Optional[str]=None,
                           notify_offset: int = 0, tag: Optional[str]=None) -> int:
         total_days = weeks * 7; added = 0
+        days = set(wdys)
+        base = self.current_date; base_dow = base.dayOfWeek() - 1  # 0 = Monday
         for d in range(1, total_days + 1):
-            date = self.current_date.addDays(d)
-            if date.dayOfWeek() in wdys:
-                if self.add_event_to_date(date, start_min, end_min, title, color_hex,
-                                          image_rel=image_rel, notify_offset=notify_offset, tag=tag):
-                    added += 1
+            if (base_dow + d) % 7 + 1 not in days:
+                continue  # weekday from arithmetic; only matching dates get a QDate and a key
+            key = self.date_key(base.addDays(d))
+            if self._add_event_to_key(key, start_min, end_min, title, color_hex,
+                                      image_rel=image_rel, notify_offset=notify_offset, tag=tag) is not None:
+                added += 1
+        if added:
+            self.save_all_data()
+        self.flush_saves()  # one data.csv rewrite for the whole batch
         return added
 
-    def add_event_to_date(self, qdate: QDate, start_min: int, end_min: int, title: str, color_hex: str,
+    def _add_event_to_key(self, key: str, start_min: int, end_min: int, title: str, color_hex: str,
                           locked: bool=False, image_rel: Optional[str]=None, notify_offset: int = 0,
-                          tag: Optional[str]=None) -> bool:
-        key = self.date_key(qdate)
-        for it in self.events_by_date.get(key, []):
-            if max(start_min, it["start_min"]) < min(end_min, it["end_min"]):
-                return False
-        self.events_by_date.setdefault(key, []).append({
+                          tag: Optional[str]=None) -> Optional[dict]:
+        """Store an event under date `key` unless it overlaps one there; no view update or save."""
+        if start_min < end_min:  # an empty span overlaps nothing
+            for it in self.events_by_date.get(key, ()):
+                s = it["start_min"]; e = it["end_min"]
+                if s < end_min and start_min < e and s < e:  # max(starts) < min(ends), without the calls
+                    return None
+        item = {
             "start_min": start_min, "end_min": end_min, "title": title, "color": color_hex,
             "tag": tag or "",
             "locked": 1 if locked else 0, "image": image_rel or "",
             "notify_offset": int(notify_offset),
-        })
+        }
+        day = self.events_by_date.get(key)
+        if day is None:
+            day = []
+            self._store_day(key, day)
+        day.append(item)
+        self._count_refs((item,), 1)
+        return item
+
+    def add_event_to_date(self, qdate: QDate, start_min: int, end_min: int, title: str, color_hex: str,
+                          locked: bool=False, image_rel: Optional[str]=None, notify_offset: int = 0,
+                          tag: Optional[str]=None) -> bool:
+        if self._add_event_to_key(self.date_key(qdate), start_min, end_min, title, color_hex, locked=locked,
+                                  image_rel=image_rel, notify_offset=notify_offset, tag=tag) is None:
+            return False
         if qdate == self.current_date:
             self.day_view.add_block(start_min, end_min - start_min, title, hex_to_qcolor(color_hex),
                                     locked=locked, image_rel=image_rel, tag=tag or "",
                                     notify_offset=notify_offset,
                                     record_history=False)
-            self.refresh_notifications()
+            self.schedule_notification_refresh()
         self.save_all_data(); return True
 
     def flash_status(self, msg: str, warn: bool = False):
@@ -3263,8 +4239,10 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, e):
         try:
+            self._notif_refresh_timer.stop()
             self.clear_notification_timers()
-            self.save_day(self.current_date); self.save_all_data(); self.save_rules()
+            self.day_view.flush_prefs_save()
+            self.save_day(self.current_date); self.flush_saves()
             self._clear_history_file()
         finally:
             super().closeEvent(e)